@@ -19,6 +19,132 @@ AWS_REGION = os.getenv("AWS_REGION", "ap-northeast-2")
 POSTS_TABLE_NAME = "HealthCommunity_Posts"
 COMMENTS_TABLE_NAME = "HealthCommunity_Comments"
 USERS_TABLE_NAME = "HealthCommunity_Users"  # [추가] 유저 테이블
+JOBS_TABLE_NAME = "HealthCommunity_Jobs"  # 백그라운드 작업 테이블
+IDEMPOTENCY_TABLE_NAME = "HealthCommunity_Idempotency"  # 게시글 생성 중복 방지(Idempotency-Key) 테이블
+
+# Idempotency-Key 기록 보관 시간 / 처리 중 잠금 시간 (서버가 죽으면 이 시간 뒤 재시도 허용)
+IDEMPOTENCY_TTL_HOURS = int(os.getenv("IDEMPOTENCY_TTL_HOURS", "24"))
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "60"))
+
+# 게시판 종류 (커뮤니티, 식단, 라이브러리)
+POST_TYPES = ["커뮤니티", "식단", "라이브러리"]
+
+# ---------------------------------------------------------
+# 인기글(Trending) 설정
+# ---------------------------------------------------------
+# 점수 = Σ(이벤트 가중치 × 시간 감쇠). 반감기가 지날 때마다 이벤트의 영향력이 절반이 됩니다.
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "6"))
+TRENDING_VIEW_WEIGHT = float(os.getenv("TRENDING_VIEW_WEIGHT", "1"))
+TRENDING_COMMENT_WEIGHT = float(os.getenv("TRENDING_COMMENT_WEIGHT", "5"))
+TRENDING_POST_WEIGHT = float(os.getenv("TRENDING_POST_WEIGHT", "10"))  # 새 글(최신성) 가중치
+# 게시판별로 추적하는 최대 게시글 수 (top-K 후보군 크기)
+TRENDING_CAPACITY = int(os.getenv("TRENDING_CAPACITY", "200"))
+# 인기글 스냅샷 저장 경로 및 주기(초)
+TRENDING_SNAPSHOT_PATH = os.getenv("TRENDING_SNAPSHOT_PATH", "trending_snapshot.json")
+TRENDING_PERSIST_INTERVAL = int(os.getenv("TRENDING_PERSIST_INTERVAL", "60"))
+
+# ---------------------------------------------------------
+# 게시글 인덱스(GSI) 설정 (작성자별 조회 / post_type 핫 파티션 샤딩)
+# ---------------------------------------------------------
+# 기존 GSI: post_type(파티션) + created_at(정렬)
+POST_TYPE_INDEX_NAME = "Type-CreatedAt-Index"
+# 작성자별 GSI: user_id(파티션) + created_at(정렬) — 내가 쓴 글 조회용
+USER_POSTS_INDEX_NAME = "User-CreatedAt-Index"
+# 샤딩 GSI: post_type_shard("식단#3" 형식, 파티션) + created_at(정렬)
+POST_SHARD_INDEX_NAME = "TypeShard-CreatedAt-Index"
+# 게시판별 샤드 개수 (0이면 샤드 키를 쓰지 않음)
+POST_TYPE_SHARDS = int(os.getenv("POST_TYPE_SHARDS", "0"))
+# 목록 조회를 샤딩 GSI로 할지 여부 (기존 게시글 백필 완료 후 true로 변경)
+POST_SHARD_READS = os.getenv("POST_SHARD_READS", "false").lower() == "true"
+
+# ---------------------------------------------------------
+# AWS 클라이언트 튜닝 (커넥션 풀 / 재시도 / 타임아웃)
+# ---------------------------------------------------------
+# 동기(def) 라우트를 실행하는 스레드풀 크기. 커넥션 풀도 이 값에 맞춰 잡습니다.
+WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "40"))
+# 커넥션 풀 크기 (기본값: 워커 동시성 + 여유분)
+AWS_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", str(WORKER_CONCURRENCY + 10)))
+AWS_MAX_ATTEMPTS = int(os.getenv("AWS_MAX_ATTEMPTS", "5"))
+AWS_CONNECT_TIMEOUT = float(os.getenv("AWS_CONNECT_TIMEOUT", "2"))
+AWS_READ_TIMEOUT = float(os.getenv("AWS_READ_TIMEOUT", "10"))
+# DynamoDB 호출 클라이언트 측 제한 (초당 요청 수, 0이면 비활성화)
+DYNAMODB_MAX_RPS = float(os.getenv("DYNAMODB_MAX_RPS", "200"))
+DYNAMODB_BURST = float(os.getenv("DYNAMODB_BURST", str(DYNAMODB_MAX_RPS)))
+# 스로틀링으로 낮춘 속도를 초당 이만큼씩 회복
+DYNAMODB_RECOVERY_RPS = float(os.getenv("DYNAMODB_RECOVERY_RPS", "5"))
+# 토큰을 이 시간(초) 안에 얻지 못하면 요청을 보내지 않고 스로틀링 에러로 실패
+DYNAMODB_MAX_WAIT = float(os.getenv("DYNAMODB_MAX_WAIT", "2"))
+
+# ---------------------------------------------------------
+# 동일 읽기 요청 병합(Single-flight) / stale-while-revalidate
+# ---------------------------------------------------------
+# 이 시간(초) 동안은 직전 결과를 그대로 반환
+READ_FRESH_TTL = float(os.getenv("READ_FRESH_TTL", "1"))
+# 이 시간(초)까지는 직전 결과를 반환하면서 백그라운드에서 갱신
+READ_STALE_TTL = float(os.getenv("READ_STALE_TTL", "5"))
+# 병합된 조회수 증가분을 DB에 반영하는 주기(초)
+VIEW_FLUSH_INTERVAL = int(os.getenv("VIEW_FLUSH_INTERVAL", "10"))
+
+# ---------------------------------------------------------
+# 백그라운드 작업(Job) 큐 설정
+# ---------------------------------------------------------
+# 작업 저장소: dynamodb(JOBS_TABLE_NAME 테이블) 또는 local(SQLite 파일)
+JOBS_BACKEND = os.getenv("JOBS_BACKEND", "dynamodb")
+JOBS_DB_PATH = os.getenv("JOBS_DB_PATH", "jobs.sqlite3")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+# 기본 큐 외 작업 큐별 워커 수 (내보내기처럼 오래 걸리는 작업은 전용 큐에서 실행)
+JOB_QUEUE_WORKERS = {
+    "export": int(os.getenv("EXPORT_JOB_WORKERS", "1")),
+}
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "2"))  # 초
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+JOB_BACKOFF_BASE = float(os.getenv("JOB_BACKOFF_BASE", "2"))  # 초 (재시도마다 2배)
+JOB_BACKOFF_MAX = float(os.getenv("JOB_BACKOFF_MAX", "300"))
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "300"))  # 실행 중 작업이 이 시간 넘게 안 끝나면 재시도
+JOB_RETENTION_DAYS = int(os.getenv("JOB_RETENTION_DAYS", "7"))  # 끝난 작업 기록 보관 기간
+
+# ---------------------------------------------------------
+# 테이블 내보내기(Export) 기본값
+# ---------------------------------------------------------
+EXPORT_SEGMENTS = int(os.getenv("EXPORT_SEGMENTS", "8"))  # 병렬 Scan 세그먼트 수
+EXPORT_WORKERS = int(os.getenv("EXPORT_WORKERS", "4"))  # 워커 프로세스 수
+EXPORT_RCU_BUDGET = float(os.getenv("EXPORT_RCU_BUDGET", "100"))  # 전체 초당 읽기 용량(RCU) 한도
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "10000"))  # 파일 하나당 대략적인 항목 수
+EXPORT_CHECKPOINT_DIR = os.getenv("EXPORT_CHECKPOINT_DIR", "export_checkpoints")
+# 관리자 API로 서버 로컬에 내보낼 때 허용되는 최상위 디렉터리 (이 아래로만 쓸 수 있음)
+EXPORT_LOCAL_ROOT = os.getenv("EXPORT_LOCAL_ROOT", "exports")
+
+# ---------------------------------------------------------
+# 작성자 프로필 캐시 (게시글/댓글 응답의 author 정보)
+# ---------------------------------------------------------
+PROFILE_CACHE_SIZE = int(os.getenv("PROFILE_CACHE_SIZE", "2048"))
+PROFILE_CACHE_TTL = int(os.getenv("PROFILE_CACHE_TTL", "300"))  # 초
+
+# ---------------------------------------------------------
+# 요청 속도 제한(Rate Limit) 설정
+# ---------------------------------------------------------
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+# 추적하는 클라이언트 키(유저/IP)의 최대 개수 (메모리 백엔드)
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+# 프록시(로드밸런서) 뒤에서 실행할 때 X-Forwarded-For에서 클라이언트 IP를 읽음
+RATE_LIMIT_TRUST_FORWARDED = os.getenv("RATE_LIMIT_TRUST_FORWARDED", "false").lower() == "true"
+# 서버 앞의 신뢰하는 프록시 수 (ALB 하나면 1). 오른쪽에서 이 순번의 항목이 프록시가 기록한 실제 클라이언트 IP
+# (왼쪽 항목은 클라이언트가 임의로 보낼 수 있으므로 사용하지 않음)
+RATE_LIMIT_TRUSTED_HOPS = int(os.getenv("RATE_LIMIT_TRUSTED_HOPS", "1"))
+# 경로별 제한 규칙 (위에서부터 처음 일치하는 규칙 하나만 적용)
+#   rate: 초당 허용 요청 수 / burst: 순간 최대 요청 수
+#   key: "user"(로그인 유저, 없으면 IP) 또는 "ip"
+RATE_LIMIT_RULES = [
+    # 로그인/회원가입: Argon2 해시 연산이 무거우므로 IP 기준으로 강하게 제한 (분당 10회)
+    {"name": "login", "method": "POST", "path": r"^/auth/login$", "rate": 10 / 60, "burst": 5, "key": "ip"},
+    {"name": "signup", "method": "POST", "path": r"^/auth/signup$", "rate": 5 / 60, "burst": 3, "key": "ip"},
+    # 검색: 테이블 전체 Scan
+    {"name": "search", "method": "GET", "path": r"^/api/v1/posts/search$", "rate": 0.5, "burst": 5, "key": "user"},
+    # 글쓰기 (S3 업로드 포함)
+    {"name": "write", "method": "POST", "path": r"^/api/v1/posts/.*", "rate": 0.5, "burst": 10, "key": "user"},
+    # 그 외 모든 API
+    {"name": "default", "method": "*", "path": r"^/", "rate": 20, "burst": 40, "key": "user"},
+]
 
 # ---------------------------------------------------------
 # 인증(Auth) 및 보안 설정 [추가됨]
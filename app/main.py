@@ -1,21 +1,71 @@
 # app/main.py
 # FastAPI 애플리케이션 진입점 및 설정
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
+import anyio.to_thread
 
-# 라우터 임포트 (게시글, 회원, 댓글)
-from .routers import posts, auth, comments
-from .services.dynamo_db import create_user_table_if_not_exists
+# 라우터 임포트 (게시글, 회원, 댓글, 관리자)
+from .routers import posts, auth, comments, admin
+from .services.dynamo_db import (
+    create_user_table_if_not_exists, get_posts, get_existing_post_ids, flush_pending_views, read_coalescer,
+)
+from .services import trending, jobs
+from .services.idempotency import create_idempotency_table_if_not_exists
+from .middleware.rate_limit import RateLimitMiddleware
+from .routers.auth import get_admin_user
+from .config import (
+    WORKER_CONCURRENCY, POST_TYPES, TRENDING_CAPACITY, TRENDING_PERSIST_INTERVAL, VIEW_FLUSH_INTERVAL,
+    RATE_LIMIT_ENABLED,
+)
+
+def prune_trending():
+    """인기글 후보 중 이미 삭제된 글을 제외합니다. (후보 수만큼 BatchGetItem)"""
+    existing = get_existing_post_ids(trending.post_ids())
+    if existing is not None:
+        trending.retain(existing)
+
+async def persist_trending_periodically():
+    """삭제된 글을 정리한 뒤 인기글 점수를 주기적으로 파일에 저장합니다."""
+    while True:
+        await asyncio.sleep(TRENDING_PERSIST_INTERVAL)
+        await anyio.to_thread.run_sync(prune_trending)
+        await anyio.to_thread.run_sync(trending.save_snapshot)
+
+async def flush_views_periodically():
+    """병합된 상세 조회의 조회수를 주기적으로 DB에 반영합니다."""
+    while True:
+        await asyncio.sleep(VIEW_FLUSH_INTERVAL)
+        await anyio.to_thread.run_sync(flush_pending_views)
 
 # 서버 수명 주기(Lifespan) 관리
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 0. 동기 라우트 스레드풀 크기를 AWS 커넥션 풀 설정과 맞춤
+    anyio.to_thread.current_default_thread_limiter().total_tokens = WORKER_CONCURRENCY
     # 1. 서버 시작 시: 유저 테이블이 없으면 생성 (온디맨드 모드)
     create_user_table_if_not_exists()
+    create_idempotency_table_if_not_exists()
+    # 1-1. 백그라운드 작업 워커 시작 (작업 테이블이 없으면 생성)
+    jobs.start_workers()
+    # 2. 인기글 점수 복원 (스냅샷이 없으면 게시판별 최근 글로 초기화)
+    # 스냅샷에는 서버가 꺼져 있는 동안 삭제된 글이 남아 있을 수 있으므로 복원 후 바로 정리
+    if trending.load_snapshot():
+        prune_trending()
+    else:
+        for post_type in POST_TYPES:
+            trending.warm_up(get_posts(post_type, limit=TRENDING_CAPACITY))
+    persist_task = asyncio.create_task(persist_trending_periodically())
+    flush_task = asyncio.create_task(flush_views_periodically())
     yield
-    # 2. 서버 종료 시: (필요하면 추가 로직 작성)
+    # 3. 서버 종료 시: 남은 조회수 반영 및 인기글 점수 저장
+    persist_task.cancel()
+    flush_task.cancel()
+    flush_pending_views()
+    trending.save_snapshot()
+    jobs.stop_workers()
 
 # FastAPI 앱 초기화
 app = FastAPI(
@@ -25,6 +75,13 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# ---------------------------------------------------------
+#  요청 속도 제한 (경로별, 로그인 유저 또는 IP 기준)
+#  CORS보다 먼저 등록해야 429 응답에도 CORS 헤더가 붙습니다.
+# ---------------------------------------------------------
+if RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
 # ---------------------------------------------------------
 #  CORS 설정 (프론트엔드 연결 필수)
 # ---------------------------------------------------------
@@ -40,6 +97,7 @@ app.add_middleware(
     allow_credentials=True,     # 쿠키/인증 정보 포함 허용
     allow_methods=["*"],        # 허용할 HTTP 메서드 (GET, POST 등 전체)
     allow_headers=["*"],        # 허용할 HTTP 헤더 (전체)
+    expose_headers=["X-Next-Cursor", "Retry-After"],  # 페이지네이션 커서 / 속도 제한 대기 시간을 프론트에서 읽을 수 있도록 노출
 )
 
 # ---------------------------------------------------------
@@ -55,9 +113,21 @@ app.include_router(auth.router, prefix="/auth", tags=["auth"])
 # 3. 댓글 API (게시글 하위 경로)
 app.include_router(comments.router, prefix="/api/v1/posts", tags=["comments"])
 
+# 4. 관리자 API (테이블 내보내기, 작업 상태)
+app.include_router(admin.router, prefix="/admin", tags=["admin"])
+
 # ---------------------------------------------------------
 # 기본 엔드포인트
 # ---------------------------------------------------------
 @app.get("/")
 def health_check():
-    return {"status": "ok", "service": "Health Community API is running"}
\ No newline at end of file
+    return {"status": "ok", "service": "Health Community API is running"}
+
+@app.get("/metrics/reads", tags=["metrics"])
+def read_coalescing_metrics(admin: dict = Depends(get_admin_user)):
+    """
+    읽기 요청 병합 통계 (관리자 전용)
+    - calls: 전체 읽기 요청 수 / backend_calls: 실제 DB 호출 수
+    - merged: 진행 중인 호출에 합류한 요청 수 / fresh_hits, stale_hits: 직전 결과로 응답한 수
+    """
+    return read_coalescer.stats()
\ No newline at end of file
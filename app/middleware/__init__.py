@@ -0,0 +1 @@
+# app.middleware package
@@ -0,0 +1,72 @@
+# app/middleware/rate_limit.py
+# 경로별 요청 속도 제한 미들웨어 (로그인 유저 또는 클라이언트 IP 기준)
+
+import math
+import re
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from jose import jwt, JWTError
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from ..config import SECRET_KEY, ALGORITHM, RATE_LIMIT_RULES, RATE_LIMIT_TRUST_FORWARDED, RATE_LIMIT_TRUSTED_HOPS
+from ..services.rate_limit import RateLimitBackend, InMemoryRateLimitBackend
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """
+    요청마다 처음 일치하는 규칙을 찾아 토큰 버킷으로 검사하고,
+    한도를 넘으면 429 응답과 Retry-After 헤더(초)를 반환합니다.
+    """
+
+    def __init__(self, app, rules: list = RATE_LIMIT_RULES, backend: RateLimitBackend | None = None):
+        super().__init__(app)
+        self.rules = [dict(rule, pattern=re.compile(rule['path'])) for rule in rules]
+        self.backend = backend or InMemoryRateLimitBackend()
+
+    def _match(self, request: Request) -> dict | None:
+        for rule in self.rules:
+            if rule['method'] in ("*", request.method) and rule['pattern'].match(request.url.path):
+                return rule
+        return None
+
+    @staticmethod
+    def _client_ip(request: Request) -> str:
+        """
+        프록시는 받은 요청의 IP를 X-Forwarded-For 끝에 덧붙이므로, 오른쪽에서 RATE_LIMIT_TRUSTED_HOPS번째 항목을 씁니다.
+        (그보다 왼쪽은 클라이언트가 보낸 값이라 요청마다 바꿔 한도를 우회할 수 있음)
+        """
+        if RATE_LIMIT_TRUST_FORWARDED and RATE_LIMIT_TRUSTED_HOPS > 0:
+            forwarded = [ip.strip() for ip in request.headers.get("x-forwarded-for", "").split(",") if ip.strip()]
+            if len(forwarded) >= RATE_LIMIT_TRUSTED_HOPS:
+                return forwarded[-RATE_LIMIT_TRUSTED_HOPS]
+        return request.client.host if request.client else "unknown"
+
+    @staticmethod
+    def _user_subject(request: Request) -> str | None:
+        """get_current_user와 같은 토큰의 sub(email). DB 조회 없이 서명만 검증합니다."""
+        auth = request.headers.get("authorization", "")
+        if not auth.lower().startswith("bearer "):
+            return None
+        try:
+            return jwt.decode(auth[7:], SECRET_KEY, algorithms=[ALGORITHM]).get("sub")
+        except JWTError:
+            return None
+
+    async def dispatch(self, request: Request, call_next):
+        # CORS preflight 요청은 제한하지 않음
+        if request.method == "OPTIONS":
+            return await call_next(request)
+        rule = self._match(request)
+        if rule is None:
+            return await call_next(request)
+
+        subject = self._user_subject(request) if rule['key'] == "user" else None
+        client_key = f"user:{subject}" if subject else f"ip:{self._client_ip(request)}"
+        retry_after = self.backend.hit(f"{rule['name']}:{client_key}", rule['rate'], rule['burst'])
+        if retry_after > 0:
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요."},
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+        return await call_next(request)
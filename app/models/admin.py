@@ -0,0 +1,33 @@
+# app/models/admin.py
+# 관리자 기능(테이블 내보내기, 작업 상태) 모델
+
+from pydantic import BaseModel, Field
+from typing import Optional
+from ..config import EXPORT_SEGMENTS, EXPORT_WORKERS, EXPORT_RCU_BUDGET, EXPORT_CHUNK_SIZE
+
+# 1. 테이블 내보내기 요청
+class ExportCreate(BaseModel):
+    table: str = Field(pattern="^(posts|comments)$", description="내보낼 테이블")
+    output: str = Field(min_length=1, description="s3://bucket/prefix 또는 EXPORT_LOCAL_ROOT 아래의 상대 경로")
+    segments: int = Field(EXPORT_SEGMENTS, ge=1, le=1000, description="병렬 Scan 세그먼트 수")
+    workers: int = Field(EXPORT_WORKERS, ge=1, le=32, description="워커 프로세스 수")
+    rcu_budget: float = Field(EXPORT_RCU_BUDGET, gt=0, description="전체 초당 읽기 용량(RCU) 한도")
+    chunk_size: int = Field(EXPORT_CHUNK_SIZE, ge=1, description="파일 하나당 대략적인 항목 수")
+    compress: bool = Field(False, description="gzip 압축 여부")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "table": "posts",
+                "output": "s3://health-project-ccc/exports/posts",
+                "compress": True
+            }
+        }
+
+# 2. 작업 상태 응답
+class JobResponse(BaseModel):
+    job_id: str
+    job_type: str
+    status: str
+    attempts: int
+    last_error: Optional[str] = None
@@ -1,6 +1,8 @@
 # app/models/comment.py
 from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import Optional
+from .user import AuthorProfile
 
 # 1. 댓글 작성 요청 (클라이언트가 보내는 데이터)
 class CommentCreate(BaseModel):
@@ -14,6 +16,7 @@ class CommentResponse(BaseModel):
     nickname: str  # 작성자 닉네임
     content: str
     created_at: str
+    author: Optional[AuthorProfile] = None  # include_author=true 일 때만 채워짐
 
     class Config:
         from_attributes = True
\ No newline at end of file
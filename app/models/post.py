@@ -3,6 +3,7 @@
 
 from pydantic import BaseModel, Field
 from typing import List, Optional
+from .user import AuthorProfile
 
 # 1. 게시글 생성 요청 모델
 class PostCreate(BaseModel):
@@ -34,6 +35,7 @@ class PostResponse(BaseModel):
     
     view_count: int = 0
     feedback_count: int = 0
+    author: Optional[AuthorProfile] = None  # include_author=true 일 때만 채워짐
 
     class Config:
         from_attributes = True
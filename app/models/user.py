@@ -29,4 +29,9 @@ class Token(BaseModel):
 class UserResponse(BaseModel):
     email: str
     nickname: str
-    role: str
\ No newline at end of file
+    role: str
+
+# 6. 작성자 프로필 (게시글/댓글 응답에 포함)
+class AuthorProfile(BaseModel):
+    user_id: str
+    nickname: str
@@ -0,0 +1,49 @@
+# app/routers/admin.py
+# 관리자 전용 API (테이블 내보내기, 백그라운드 작업 상태 조회)
+
+import os
+import uuid
+from fastapi import APIRouter, HTTPException, Depends
+
+from ..models.admin import ExportCreate, JobResponse
+from ..services.jobs import enqueue, get_job
+from ..services.table_export import export_table_job  # 작업 핸들러 등록
+from ..config import EXPORT_CHECKPOINT_DIR, EXPORT_LOCAL_ROOT
+from .auth import get_admin_user
+
+router = APIRouter()
+
+def _resolve_export_output(output: str) -> str:
+    """
+    S3 경로는 그대로, 로컬 경로는 EXPORT_LOCAL_ROOT 아래의 절대 경로로 바꿉니다.
+    루트 밖을 가리키는 경로(절대 경로, ../ 등)는 거부합니다.
+    """
+    if output.startswith("s3://"):
+        return output
+    root = os.path.realpath(EXPORT_LOCAL_ROOT)
+    path = os.path.realpath(os.path.join(root, output))
+    if os.path.commonpath([root, path]) != root:
+        raise HTTPException(status_code=422, detail=f"로컬 내보내기 경로는 {EXPORT_LOCAL_ROOT} 아래의 상대 경로여야 합니다.")
+    return path
+
+# 1. 테이블 내보내기 예약 API
+@router.post("/exports", response_model=JobResponse, status_code=202, summary="테이블 내보내기 (백그라운드)")
+def create_export(export: ExportCreate, admin: dict = Depends(get_admin_user)):
+    """
+    게시글/댓글 테이블을 병렬 Scan으로 내보내는 작업을 예약합니다.
+    작업마다 별도의 체크포인트를 쓰므로 실패 후 재시도되면 중단된 지점부터 이어서 진행합니다.
+    """
+    export_id = str(uuid.uuid4())
+    payload = export.model_dump()
+    payload['output'] = _resolve_export_output(export.output)
+    payload['checkpoint_dir'] = os.path.join(EXPORT_CHECKPOINT_DIR, export_id)
+    job_id = enqueue("export_table", payload, job_id=f"export_table:{export_id}")
+    return get_job(job_id)
+
+# 2. 작업 상태 조회 API
+@router.get("/jobs/{job_id}", response_model=JobResponse, summary="백그라운드 작업 상태 조회")
+def read_job(job_id: str, admin: dict = Depends(get_admin_user)):
+    job = get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
@@ -6,7 +6,8 @@ from jose import jwt, JWTError
 import re
 
 from ..models import user as user_models
-from ..services import dynamo_db
+from ..services import dynamo_db, profiles
+from ..services.cleanup_jobs import enqueue_user_cleanup, try_enqueue
 from ..config import SECRET_KEY, ALGORITHM, ADMIN_SECRET_CODE
 
 router = APIRouter()
@@ -45,6 +46,12 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
     return user
 
+def get_admin_user(current_user: dict = Depends(get_current_user)):
+    """관리자(admin) 권한 확인"""
+    if current_user.get('role') != "admin":
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
+    return current_user
+
 # --- API 엔드포인트 ---
 
 @router.post("/signup", status_code=201, summary="회원가입")
@@ -92,6 +99,10 @@ def delete_me(user: user_models.UserDelete, current_user: dict = Depends(get_cur
         raise HTTPException(status_code=401, detail="비밀번호가 일치하지 않습니다.")
     
     if dynamo_db.delete_user(current_user['email']):
+        profiles.invalidate(current_user['email'])
+        # 작성한 게시글/댓글/이미지는 백그라운드 작업으로 정리
+        # 회원 정보는 이미 삭제되어 클라이언트가 다시 요청할 수 없으므로 예약 실패는 로그로 남김
+        try_enqueue(enqueue_user_cleanup, current_user['email'])
         return {"message": "회원 탈퇴가 완료되었습니다."}
     else:
         raise HTTPException(status_code=500, detail="탈퇴 처리 중 오류가 발생했습니다.")
\ No newline at end of file
@@ -1,9 +1,10 @@
 # app/routers/comments.py
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query
 from typing import List
 
 from ..models.comment import CommentCreate, CommentResponse
 from ..services.dynamo_db import create_comment, get_comments , delete_comment 
+from ..services.profiles import hydrate_authors
 from .auth import get_current_user
 
 router = APIRouter()
@@ -28,8 +29,12 @@ def write_comment(
 
 # 2. 댓글 목록 조회 API
 @router.get("/{post_id}/comments", response_model=List[CommentResponse])
-def read_comments(post_id: str):
-    return get_comments(post_id)
+def read_comments(
+    post_id: str,
+    include_author: bool = Query(False, description="작성자 프로필(최신 닉네임) 포함 여부")
+):
+    comments = get_comments(post_id)
+    return hydrate_authors(comments) if include_author else comments
 
 # 3. 댓글 삭제 API
 @router.delete("/{post_id}/comments/{comment_id}", status_code=204)
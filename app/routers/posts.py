@@ -1,31 +1,53 @@
 # app/routers/posts.py
 
 import uuid
-from typing import List
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status, Depends, Query
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status, Depends, Query, Response, Header
+from fastapi.concurrency import run_in_threadpool
 from pydantic import ValidationError
 
 # 모델 임포트
 from ..models.post import PostCreate, PostResponse
 
 # S3 서비스 임포트
-from ..services.aws_s3 import upload_file_to_s3, delete_file_from_s3
+from ..services.aws_s3 import upload_file_to_s3
 
 # DynamoDB 서비스 임포트 (모든 로직 포함)
 from ..services.dynamo_db import (
     create_post_item, 
     get_posts, 
     get_post_detail, 
+    get_post,
     delete_post_item, 
-    delete_comments_by_post_id,
     update_post_item,
     search_posts,
     get_posts_by_user  # 👈 [추가] 내가 쓴 글 조회 함수 임포트
 )
+from ..services.trending import get_trending
+from ..services.profiles import hydrate_authors
+from ..services import idempotency
+# 백그라운드 정리 작업 (S3 파일 / 댓글 삭제)
+from ..services.cleanup_jobs import enqueue_post_cleanup, enqueue_file_cleanup, try_enqueue
 from .auth import get_current_user 
 
 router = APIRouter()
 
+def _parse_time_bound(value: Optional[str], name: str) -> Optional[str]:
+    """
+    since/until 쿼리 값을 ISO 8601로 검증하고 created_at과 같은 형식(서버 로컬 시각, 타임존 없음)으로 바꿉니다.
+    타임존이 있는 값(예: ...Z, +09:00)은 서버 로컬 시각으로 변환합니다.
+    """
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"{name}은(는) ISO 8601 형식이어야 합니다. (예: 2026-10-19T09:00:00)")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.isoformat()
+
 # ---------------------------------------------------------
 # 1. 게시글 생성 API (POST)
 # ---------------------------------------------------------
@@ -35,6 +57,8 @@ async def create_post(
     title: str = Form(...),
     content: str = Form(...),
     post_type: str = Form(...),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255,
+                                            description="재시도 시 같은 값을 보내면 게시글이 중복 생성되지 않음"),
     current_user: dict = Depends(get_current_user) 
 ):
     try:
@@ -44,20 +68,57 @@ async def create_post(
         
     real_user_id = current_user['email']
     new_post_id = str(uuid.uuid4()) 
-    uploaded_urls = []
-    
-    if files:
-        for file in files:
-            if file.filename: 
-                url = await upload_file_to_s3(file, new_post_id)
-                if url: uploaded_urls.append(url)
-                else: raise HTTPException(status_code=500, detail="파일 업로드 실패")
 
-    post_item_data = {"title": post_data.title, "content": post_data.content, "post_type": post_data.post_type}
-    db_item = create_post_item(post_item_data, uploaded_urls, real_user_id, new_post_id)
-    
-    if not db_item:
-        raise HTTPException(status_code=500, detail="DB 저장 실패")
+    # async 라우트이므로 boto3(블로킹) 호출은 모두 스레드풀에서 실행해 이벤트 루프를 막지 않음
+    # Idempotency-Key가 있으면 키를 선점하고, 이미 처리된 요청이면 저장된 결과를 그대로 반환
+    if idempotency_key:
+        fingerprint = idempotency.request_fingerprint(post_data.title, post_data.content, post_data.post_type)
+        result = await run_in_threadpool(idempotency.begin, real_user_id, idempotency_key, fingerprint)
+        if result['status'] == "completed":
+            return result['record']['response']
+        if result['status'] == "in_progress":
+            raise HTTPException(status_code=409, detail="같은 요청을 처리 중입니다.", headers={"Retry-After": "1"})
+        if result['status'] == "mismatch":
+            raise HTTPException(status_code=422, detail="같은 Idempotency-Key로 다른 내용의 요청을 보낼 수 없습니다.")
+        new_post_id = result['record']['post_id']
+
+        # 이전 시도가 게시글까지 저장한 뒤 완료 기록만 못 남겼으면, 다시 업로드하지 않고 그 게시글로 완료 처리
+        if result['resumed']:
+            existing_post = await run_in_threadpool(get_post, new_post_id)
+            if existing_post:
+                await run_in_threadpool(idempotency.complete, real_user_id, idempotency_key, existing_post)
+                return existing_post
+
+    try:
+        uploaded_urls = []
+        
+        if files:
+            for file in files:
+                if file.filename: 
+                    url = await upload_file_to_s3(file, new_post_id)
+                    if url: uploaded_urls.append(url)
+                    else: raise HTTPException(status_code=500, detail="파일 업로드 실패")
+
+        post_item_data = {"title": post_data.title, "content": post_data.content, "post_type": post_data.post_type}
+        # Idempotency-Key 요청은 같은 post_id를 재사용하므로 기존 게시글을 덮어쓰지 않도록 조건부 저장
+        db_item = await run_in_threadpool(create_post_item, post_item_data, uploaded_urls, real_user_id, new_post_id,
+                                          only_if_new=bool(idempotency_key))
+        
+        if not db_item:
+            raise HTTPException(status_code=500, detail="DB 저장 실패")
+    except Exception:
+        # 실패한 요청은 같은 키로 다시 시도할 수 있도록 기록 삭제
+        if idempotency_key:
+            await run_in_threadpool(idempotency.release, real_user_id, idempotency_key)
+        raise
+
+    if idempotency_key:
+        await run_in_threadpool(idempotency.complete, real_user_id, idempotency_key, db_item)
+
+    # 다른 시도가 먼저 저장해 이번에 올린 파일이 게시글에 쓰이지 않았으면 백그라운드에서 삭제
+    unused_urls = [url for url in uploaded_urls if url not in db_item.get('file_urls', [])]
+    if unused_urls:
+        await run_in_threadpool(try_enqueue, enqueue_file_cleanup, unused_urls)
 
     return db_item
 
@@ -66,41 +127,93 @@ async def create_post(
 # ---------------------------------------------------------
 @router.get("/search", response_model=List[PostResponse], summary="게시글 검색")
 def search_community_posts(
-    keyword: str = Query(..., min_length=1, description="검색할 키워드 (제목/내용)")
+    keyword: str = Query(..., min_length=1, description="검색할 키워드 (제목/내용)"),
+    include_author: bool = Query(False, description="작성자 프로필(닉네임) 포함 여부")
 ):
     """
     키워드가 제목이나 내용에 포함된 게시글을 검색합니다.
     """
-    return search_posts(keyword)
+    posts = search_posts(keyword)
+    return hydrate_authors(posts) if include_author else posts
 
 # ---------------------------------------------------------
 # 3. 내가 쓴 글 조회 API (GET /me) 
 # ---------------------------------------------------------
 @router.get("/me", response_model=List[PostResponse], summary="내가 쓴 글 조회")
 def read_my_posts(
+    response: Response,
+    since: Optional[str] = Query(None, description="이 시각 이후 글만 (ISO 8601, 포함)"),
+    until: Optional[str] = Query(None, description="이 시각 이전 글만 (ISO 8601, 미포함)"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="정렬 (desc: 최신순, asc: 오래된순)"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="한 번에 가져올 개수 (없으면 전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    include_author: bool = Query(False, description="작성자 프로필(닉네임) 포함 여부"),
     current_user: dict = Depends(get_current_user) # 로그인 필수
 ):
     """
     현재 로그인한 사용자가 작성한 게시글 목록을 반환합니다.
     """
-    return get_posts_by_user(current_user['email'])
+    since = _parse_time_bound(since, "since")
+    until = _parse_time_bound(until, "until")
+    posts = get_posts_by_user(current_user['email'], limit, cursor, since, until, order == "asc")
+    if limit is not None and len(posts) == limit:
+        response.headers["X-Next-Cursor"] = posts[-1]['created_at']
+    return hydrate_authors(posts) if include_author else posts
+
+# ---------------------------------------------------------
+# 3-1. 인기글 조회 API (GET /trending)
+# ---------------------------------------------------------
+@router.get("/trending", response_model=List[PostResponse], summary="인기글 조회")
+def read_trending_posts(
+    post_type: str = Query(..., description="게시판 종류"),
+    limit: int = Query(10, ge=1, le=50, description="가져올 인기글 개수"),
+    include_author: bool = Query(False, description="작성자 프로필(닉네임) 포함 여부")
+):
+    """
+    조회수·댓글·최신성을 시간 감쇠 점수로 합산한 인기글을 반환합니다.
+    점수는 이벤트마다 메모리에서 갱신되므로 DB를 조회하지 않습니다.
+    """
+    posts = get_trending(post_type, limit)
+    return hydrate_authors(posts) if include_author else posts
 
 # ---------------------------------------------------------
 # 4. 게시글 목록 조회 API (GET /)
 # ---------------------------------------------------------
 @router.get("/", response_model=List[PostResponse], summary="게시글 목록 조회")
-def read_posts(post_type: str = Query(..., description="게시판 종류")):
-    return get_posts(post_type)
+def read_posts(
+    response: Response,
+    post_type: str = Query(..., description="게시판 종류"),
+    since: Optional[str] = Query(None, description="이 시각 이후 글만 (ISO 8601, 포함)"),
+    until: Optional[str] = Query(None, description="이 시각 이전 글만 (ISO 8601, 미포함)"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="정렬 (desc: 최신순, asc: 오래된순)"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="한 번에 가져올 개수 (없으면 전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    include_author: bool = Query(False, description="작성자 프로필(닉네임) 포함 여부")
+):
+    """
+    게시판 글을 created_at 기준으로 정렬해 반환합니다. (기본: 최신순)
+    since/until은 DB 정렬 키 조건으로 처리되어 기간 내 글만 읽습니다.
+    limit을 주면 다음 페이지 커서를 X-Next-Cursor 응답 헤더로 내려줍니다.
+    """
+    since = _parse_time_bound(since, "since")
+    until = _parse_time_bound(until, "until")
+    posts = get_posts(post_type, limit, cursor, since, until, order == "asc")
+    if limit is not None and len(posts) == limit:
+        response.headers["X-Next-Cursor"] = posts[-1]['created_at']
+    return hydrate_authors(posts) if include_author else posts
 
 # ---------------------------------------------------------
 # 5. 게시글 상세 조회 API (GET /{post_id})
 # ---------------------------------------------------------
 @router.get("/{post_id}", response_model=PostResponse, summary="게시글 상세 조회")
-def read_post_detail(post_id: str):
+def read_post_detail(
+    post_id: str,
+    include_author: bool = Query(False, description="작성자 프로필(닉네임) 포함 여부")
+):
     post = get_post_detail(post_id)
     if not post:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
-    return post
+    return hydrate_authors([post])[0] if include_author else post
 
 # ---------------------------------------------------------
 # 6. 게시글 삭제 API (DELETE)
@@ -110,24 +223,20 @@ def delete_post(
     post_id: str,
     current_user: dict = Depends(get_current_user)
 ):
-    post = get_post_detail(post_id)
+    post = get_post(post_id)
     if not post:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
     
     if post['user_id'] != current_user['email']:
         raise HTTPException(status_code=403, detail="삭제 권한이 없습니다.")
         
-    # S3 파일 삭제
-    if post.get('file_urls'):
-        for url in post['file_urls']:
-            delete_file_from_s3(url)
-    
-    # 댓글 데이터 삭제
-    delete_comments_by_post_id(post_id)
-            
     # 게시글 데이터 삭제
     if not delete_post_item(post_id, current_user['email']):
         raise HTTPException(status_code=500, detail="삭제 중 오류가 발생했습니다.")
+
+    # S3 파일 및 댓글 삭제는 백그라운드 작업으로 처리 (게시글 크기와 무관하게 바로 응답)
+    # 게시글은 이미 삭제됐으므로 예약 실패는 500 대신 로그로 남김
+    try_enqueue(enqueue_post_cleanup, post_id)
         
     return 
 
@@ -144,7 +253,7 @@ async def update_post(
     current_user: dict = Depends(get_current_user)
 ):
     # 1. 기존 게시글 확인
-    old_post = get_post_detail(post_id)
+    old_post = get_post(post_id)
     if not old_post:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
     
@@ -155,11 +264,6 @@ async def update_post(
     new_file_urls = None 
 
     if files:
-        # 기존 파일 S3 삭제
-        if old_post.get('file_urls'):
-            for url in old_post['file_urls']:
-                delete_file_from_s3(url)
-        
         # 새 파일 S3 업로드
         new_file_urls = []
         for file in files:
@@ -180,5 +284,9 @@ async def update_post(
     
     if not updated_post:
         raise HTTPException(status_code=500, detail="게시글 수정 중 오류 발생")
+
+    # 4. 교체된 기존 파일은 백그라운드에서 S3 삭제 (수정은 이미 저장됐으므로 예약 실패는 로그로 남김)
+    if new_file_urls is not None:
+        try_enqueue(enqueue_file_cleanup, old_post.get('file_urls', []))
         
     return updated_post
\ No newline at end of file
@@ -0,0 +1,110 @@
+# app/services/aws_client.py
+# 공용 AWS 클라이언트 팩토리 (S3, DynamoDB 서비스에서 공통 사용)
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from ..config import (
+    AWS_REGION,
+    AWS_MAX_POOL_CONNECTIONS,
+    AWS_MAX_ATTEMPTS,
+    AWS_CONNECT_TIMEOUT,
+    AWS_READ_TIMEOUT,
+    DYNAMODB_MAX_RPS,
+    DYNAMODB_BURST,
+    DYNAMODB_RECOVERY_RPS,
+    DYNAMODB_MAX_WAIT,
+)
+from .token_bucket import TokenBucket
+
+# 🛠️ 환경 변수 공백 제거 (Invalid endpoint 에러 방지용)
+SAFE_REGION = AWS_REGION.strip() if AWS_REGION else "ap-northeast-2"
+
+# 모든 클라이언트가 공유하는 설정
+# - max_pool_connections: 스레드풀 워커 수에 맞춰 커넥션 대기 방지
+# - adaptive 재시도: 스로틀링 응답을 받으면 클라이언트가 스스로 전송 속도를 낮춤
+# - 타임아웃 + TCP keep-alive: 끊긴 커넥션에 워커가 묶이지 않도록 함
+CLIENT_CONFIG = Config(
+    region_name=SAFE_REGION,
+    max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+    retries={"mode": "adaptive", "max_attempts": AWS_MAX_ATTEMPTS},
+    connect_timeout=AWS_CONNECT_TIMEOUT,
+    read_timeout=AWS_READ_TIMEOUT,
+    tcp_keepalive=True,
+)
+
+# DynamoDB 스로틀링 에러 코드
+THROTTLE_ERROR_CODES = {
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+}
+
+# boto3 Session은 스레드 안전하지 않으므로 모듈 로드 시 한 번만 만들고 재사용합니다.
+_session = boto3.session.Session(region_name=SAFE_REGION)
+_clients = {}
+_resources = {}
+
+# DynamoDB 요청용 토큰 버킷 (DYNAMODB_MAX_RPS가 0이면 비활성화)
+dynamodb_limiter = TokenBucket(DYNAMODB_MAX_RPS, DYNAMODB_BURST) if DYNAMODB_MAX_RPS > 0 else None
+
+# ---------------------------------------------------------
+# 1. DynamoDB 클라이언트 측 속도 제한 훅
+# ---------------------------------------------------------
+def _acquire_dynamodb_token(event_name: str = "", **kwargs):
+    """
+    요청(재시도 포함)을 보내기 직전에 토큰을 소비합니다.
+    토큰이 부족하면 DYNAMODB_MAX_WAIT초까지 대기하고, 그래도 없으면 요청을 보내지 않고
+    ThrottlingException(ClientError)으로 바로 실패시켜 호출부의 기존 에러 처리를 따르게 합니다.
+    """
+    if dynamodb_limiter.acquire(timeout=DYNAMODB_MAX_WAIT):
+        return None
+    operation_name = event_name.rsplit(".", 1)[-1]
+    raise ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "클라이언트 측 DynamoDB 요청 한도 초과"}},
+        operation_name,
+    )
+
+def _observe_dynamodb_response(response=None, **kwargs):
+    """
+    응답을 보고 스로틀링이면 전송 속도를 낮추고, 정상이면 천천히 회복합니다.
+    (재시도 여부 판단에는 관여하지 않도록 항상 None을 반환)
+    """
+    if response is None:
+        return None
+    _, parsed = response
+    error_code = parsed.get("Error", {}).get("Code")
+    if error_code in THROTTLE_ERROR_CODES:
+        dynamodb_limiter.penalize()
+    elif error_code is None:
+        dynamodb_limiter.recover(DYNAMODB_RECOVERY_RPS)
+    return None
+
+def _register_limiter(client):
+    if client.meta.service_model.service_name != "dynamodb" or dynamodb_limiter is None:
+        return
+    client.meta.events.register("before-send.dynamodb", _acquire_dynamodb_token)
+    client.meta.events.register_first("needs-retry.dynamodb", _observe_dynamodb_response)
+
+# ---------------------------------------------------------
+# 2. 클라이언트 / 리소스 생성 함수
+# ---------------------------------------------------------
+def get_client(service_name: str):
+    """
+    서비스별 boto3 클라이언트를 하나만 만들어 재사용합니다. (클라이언트는 스레드 안전)
+    """
+    if service_name not in _clients:
+        client = _session.client(service_name, config=CLIENT_CONFIG)
+        _register_limiter(client)
+        _clients[service_name] = client
+    return _clients[service_name]
+
+def get_resource(service_name: str):
+    """
+    서비스별 boto3 리소스(DynamoDB Table 등)를 하나만 만들어 재사용합니다.
+    """
+    if service_name not in _resources:
+        resource = _session.resource(service_name, config=CLIENT_CONFIG)
+        _register_limiter(resource.meta.client)
+        _resources[service_name] = resource
+    return _resources[service_name]
@@ -3,19 +3,13 @@
 
 
 import uuid
-import boto3
 from fastapi import UploadFile
 from botocore.exceptions import ClientError
-from ..config import AWS_REGION, S3_BUCKET_NAME
+from ..config import S3_BUCKET_NAME
+from .aws_client import get_client, SAFE_REGION
 
-# 🛠️ 환경 변수 공백 제거 (Invalid endpoint 에러 방지용)
-if AWS_REGION:
-    SAFE_REGION = AWS_REGION.strip()
-else:
-    SAFE_REGION = "ap-northeast-2"
-
-# S3 클라이언트 초기화
-s3_client = boto3.client('s3', region_name=SAFE_REGION)
+# S3 클라이언트 초기화 (공용 클라이언트 팩토리 사용)
+s3_client = get_client('s3')
 
 # ---------------------------------------------------------
 # 1. 파일 업로드 함수
@@ -60,12 +54,12 @@ async def upload_file_to_s3(file: UploadFile, post_id: str) -> str | None:
 # ---------------------------------------------------------
 # 2. 파일 삭제 함수 (게시글 삭제 시 사용) 
 # ---------------------------------------------------------
-def delete_file_from_s3(file_url: str):
+def delete_file_from_s3(file_url: str) -> bool:
     """
-    S3 URL을 받아 해당 파일을 버킷에서 삭제합니다.
+    S3 URL을 받아 해당 파일을 버킷에서 삭제합니다. (성공 또는 삭제할 것이 없으면 True)
     """
     if not file_url:
-        return
+        return True
 
     try:
         # URL에서 도메인을 제외한 file_key(경로)만 추출
@@ -77,8 +71,41 @@ def delete_file_from_s3(file_url: str):
             Key=file_key
         )
         print(f"🗑️ S3 File Deleted: {file_key}")
+        return True
         
     except ClientError as e:
         print(f"❌ S3 Delete Error: {e}")
+        return False
     except Exception as e:
-        print(f"❌ S3 Delete Unexpected Error: {e}")
\ No newline at end of file
+        print(f"❌ S3 Delete Unexpected Error: {e}")
+        return False
+
+# ---------------------------------------------------------
+# 3. 게시글 폴더 전체 삭제 함수 (백그라운드 정리 작업에서 사용)
+# ---------------------------------------------------------
+def delete_post_files(post_id: str) -> bool:
+    """
+    posts/{post_id}/ 아래의 모든 파일을 1000개 단위로 일괄 삭제합니다.
+    이미 지워진 경우에도 True를 반환하므로 여러 번 호출해도 안전합니다.
+    """
+    try:
+        paginator = s3_client.get_paginator('list_objects_v2')
+        deleted = 0
+        for page in paginator.paginate(Bucket=S3_BUCKET_NAME, Prefix=f"posts/{post_id}/"):
+            objects = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+            if not objects:
+                continue
+            response = s3_client.delete_objects(
+                Bucket=S3_BUCKET_NAME,
+                Delete={'Objects': objects, 'Quiet': True}
+            )
+            if response.get('Errors'):
+                print(f"❌ S3 Bulk Delete Error: {response['Errors'][:3]}")
+                return False
+            deleted += len(objects)
+        if deleted:
+            print(f"🗑️ S3 Files Deleted: posts/{post_id}/ ({deleted}개)")
+        return True
+    except ClientError as e:
+        print(f"❌ S3 Bulk Delete Error: {e}")
+        return False
\ No newline at end of file
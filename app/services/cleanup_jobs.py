@@ -0,0 +1,73 @@
+# app/services/cleanup_jobs.py
+# 게시글/회원 삭제 후 연관 데이터 정리 작업 (백그라운드 실행)
+
+from datetime import datetime
+from .jobs import job_handler, enqueue
+from .aws_s3 import delete_file_from_s3, delete_post_files
+from .dynamo_db import (
+    delete_comments_by_post_id,
+    purge_post_item,
+    purge_comment,
+    query_posts_by_user,
+    get_comments_by_user,
+)
+
+# ---------------------------------------------------------
+# 1. 작업 추가 함수 (라우터에서 호출)
+# ---------------------------------------------------------
+
+def enqueue_post_cleanup(post_id: str) -> str:
+    """삭제된 게시글의 이미지와 댓글 정리를 예약합니다. (게시글당 한 번만 예약됨)"""
+    return enqueue("delete_post_content", {"post_id": post_id}, job_id=f"delete_post_content:{post_id}")
+
+def enqueue_file_cleanup(file_urls: list) -> str | None:
+    """게시글 수정으로 교체된 이전 이미지 삭제를 예약합니다."""
+    if not file_urls:
+        return None
+    return enqueue("delete_files", {"file_urls": file_urls})
+
+def enqueue_user_cleanup(email: str) -> str:
+    """탈퇴한 회원의 게시글/댓글/이미지 정리를 예약합니다."""
+    deleted_at = datetime.now().isoformat()
+    return enqueue("delete_user_content", {"email": email}, job_id=f"delete_user_content:{email}:{deleted_at}")
+
+def try_enqueue(enqueue_fn, *args) -> str | None:
+    """
+    삭제/수정이 이미 DB에 반영된 뒤 정리 작업을 예약할 때 사용합니다.
+    클라이언트는 다시 요청해도 404 등으로 정리를 재시도할 수 없으므로, 예약이 실패해도 응답을 실패시키지 않고
+    수동으로 다시 예약할 수 있도록 함수 이름과 인자를 로그로 남깁니다.
+    """
+    try:
+        return enqueue_fn(*args)
+    except Exception as e:
+        print(f"❌ 정리 작업 예약 실패 (수동 예약 필요: {enqueue_fn.__name__}{args}): {e}")
+        return None
+
+# ---------------------------------------------------------
+# 2. 작업 핸들러 (모두 멱등: 중간에 실패해 다시 실행돼도 결과가 같음)
+# ---------------------------------------------------------
+
+@job_handler("delete_post_content")
+def delete_post_content(post_id: str):
+    if not delete_post_files(post_id):
+        raise RuntimeError(f"S3 파일 삭제 실패: {post_id}")
+    if not delete_comments_by_post_id(post_id):
+        raise RuntimeError(f"댓글 삭제 실패: {post_id}")
+
+@job_handler("delete_files")
+def delete_files(file_urls: list):
+    failed = [url for url in file_urls if not delete_file_from_s3(url)]
+    if failed:
+        raise RuntimeError(f"S3 파일 {len(failed)}개 삭제 실패")
+
+@job_handler("delete_user_content")
+def delete_user_content(email: str):
+    # 조회/삭제 실패는 예외로 올려 작업 전체를 재시도 (이미 삭제된 항목은 purge_*가 성공으로 처리)
+    # 1. 회원이 쓴 게시글 삭제 → 게시글별 정리 작업 예약
+    for post in query_posts_by_user(email):
+        purge_post_item(post['post_id'], email)
+        enqueue_post_cleanup(post['post_id'])
+
+    # 2. 다른 게시글에 남긴 댓글 삭제
+    for comment in get_comments_by_user(email):
+        purge_comment(comment['post_id'], comment['created_at'], email)
@@ -1,14 +1,28 @@
 # app/services/dynamo_db.py
 
-import boto3
+import heapq
+import random
+import threading
+import time
+import zlib
 from datetime import datetime
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from botocore.exceptions import ClientError
 # 쿼리 조건(Key) 및 검색 조건(Attr) 임포트
 from boto3.dynamodb.conditions import Key, Attr
-from ..config import AWS_REGION, POSTS_TABLE_NAME, COMMENTS_TABLE_NAME, USERS_TABLE_NAME
+from ..config import (
+    POSTS_TABLE_NAME, COMMENTS_TABLE_NAME, USERS_TABLE_NAME,
+    POST_TYPE_INDEX_NAME, POST_SHARD_INDEX_NAME, POST_TYPE_SHARDS, POST_SHARD_READS,
+    USER_POSTS_INDEX_NAME,
+    WORKER_CONCURRENCY, READ_FRESH_TTL, READ_STALE_TTL,
+)
+from .aws_client import get_resource
+from .single_flight import SingleFlight
+from . import trending
 
-# DynamoDB 리소스 초기화
-dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
+# DynamoDB 리소스 초기화 (공용 클라이언트 팩토리 사용)
+dynamodb = get_resource('dynamodb')
 
 # 테이블 객체 연결
 try:
@@ -22,11 +36,97 @@ except Exception as e:
     comments_table = None
     users_table = None
 
+# 샤드별 병렬 쿼리(scatter-gather)용 스레드풀
+_shard_pool = ThreadPoolExecutor(max_workers=WORKER_CONCURRENCY)
+
+# 동일한 읽기(목록/상세/댓글) 요청 병합기
+# key: ("posts", ...조회 조건) / ("post_detail", post_id) / ("comments", post_id)
+read_coalescer = SingleFlight(READ_FRESH_TTL, READ_STALE_TTL)
+
+# 병합된 상세 조회의 조회수 증가분 { post_id: 아직 DB에 반영되지 않은 조회 수 }
+_pending_views: dict[str, int] = {}
+_views_lock = threading.Lock()
+
+# BatchGetItem의 UnprocessedKeys 재요청 횟수와 백오프(초)
+_BATCH_GET_MAX_ATTEMPTS = 4
+_BATCH_GET_BACKOFF_BASE = 0.05
+_BATCH_GET_BACKOFF_MAX = 1.0
+
+# ---------------------------------------------------------
+# 0. 공통 헬퍼 (페이지 조회 / 게시판 샤드 키)
+# ---------------------------------------------------------
+
+def _query_pages(table, limit: int | None = None, **kwargs) -> list:
+    """
+    LastEvaluatedKey를 따라가며 Query 결과를 모읍니다. limit이 있으면 그 개수까지만 가져옵니다.
+    """
+    items = []
+    while True:
+        if limit is not None:
+            kwargs['Limit'] = limit - len(items)
+        response = table.query(**kwargs)
+        items.extend(response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key or (limit is not None and len(items) >= limit):
+            return items
+        kwargs['ExclusiveStartKey'] = last_key
+
+def _query_by_created_at(index_name: str, key_cond, limit: int | None, cursor: str | None,
+                         since: str | None, until: str | None, ascending: bool) -> list:
+    """
+    created_at 정렬 키 범위(since 이상, until 미만, cursor 이후)를 KeyConditionExpression으로 조회합니다.
+    정렬 키 조건은 하나만 쓸 수 있으므로 양쪽 범위가 모두 있으면 between(양끝 포함)으로 읽고
+    제외해야 할 경계값(until, cursor)만 결과에서 걸러냅니다.
+    """
+    lower, upper = since, until
+    lower_exclusive = False
+    if cursor:
+        if ascending:
+            if lower is None or cursor >= lower:
+                lower, lower_exclusive = cursor, True
+        elif upper is None or cursor < upper:
+            upper = cursor
+
+    excluded = set()
+    if lower is not None and upper is not None:
+        if lower >= upper:
+            return []
+        key_cond = key_cond & Key('created_at').between(lower, upper)
+        excluded.add(upper)
+        if lower_exclusive:
+            excluded.add(lower)
+    elif lower is not None:
+        key_cond = key_cond & (Key('created_at').gt(lower) if lower_exclusive else Key('created_at').gte(lower))
+    elif upper is not None:
+        key_cond = key_cond & Key('created_at').lt(upper)
+
+    items = _query_pages(
+        posts_table, limit + len(excluded) if limit is not None else None,
+        IndexName=index_name,
+        KeyConditionExpression=key_cond,
+        ScanIndexForward=ascending
+    )
+    if excluded:
+        items = [item for item in items if item['created_at'] not in excluded]
+    return items[:limit] if limit is not None else items
+
+def post_shard_key(post_type: str, post_id: str) -> str:
+    """
+    게시글을 게시판 내 샤드에 고르게 분배하는 키를 만듭니다. (예: "식단#3")
+    post_id 해시로 정하므로 같은 게시글은 항상 같은 샤드에 들어갑니다.
+    """
+    return f"{post_type}#{zlib.crc32(post_id.encode('utf-8')) % POST_TYPE_SHARDS}"
+
 # ---------------------------------------------------------
 # 1. 게시글 관련 로직 (CRUD + Search + MyPage)
 # ---------------------------------------------------------
 
-def create_post_item(post_data: dict, file_urls: list, user_id: str, post_id: str) -> dict | None:
+def create_post_item(post_data: dict, file_urls: list, user_id: str, post_id: str,
+                     only_if_new: bool = False) -> dict | None:
+    """
+    게시글을 저장합니다.
+    only_if_new=True면 같은 post_id가 이미 있을 때 덮어쓰지 않고 기존 게시글을 반환합니다. (Idempotency-Key 재시도용)
+    """
     if posts_table is None: return None
     try:
         timestamp = datetime.now().isoformat()
@@ -42,8 +142,21 @@ def create_post_item(post_data: dict, file_urls: list, user_id: str, post_id: st
             'created_at': timestamp,
             'updated_at': timestamp,
         }
-        response = posts_table.put_item(Item=item)
+        if POST_TYPE_SHARDS > 0:
+            item['post_type_shard'] = post_shard_key(post_data['post_type'], post_id)
+        put_kwargs = {'Item': item}
+        if only_if_new:
+            put_kwargs['ConditionExpression'] = 'attribute_not_exists(post_id)'
+        try:
+            response = posts_table.put_item(**put_kwargs)
+        except ClientError as e:
+            if not only_if_new or e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            print(f"ℹ 이미 저장된 게시글입니다. 기존 게시글을 반환합니다: {post_id}")
+            return get_post(post_id)
         if response['ResponseMetadata']['HTTPStatusCode'] == 200:
+            trending.record_post(item)
+            read_coalescer.forget("posts", post_data['post_type'])
             return item
     except ClientError as e:
         print(f"DynamoDB PutItem Error: {e}")
@@ -52,44 +165,157 @@ def create_post_item(post_data: dict, file_urls: list, user_id: str, post_id: st
         print(f"DB Error: {e}")
         return None
 
-def get_posts(post_type: str) -> list:
+def get_posts(post_type: str, limit: int | None = None, cursor: str | None = None,
+              since: str | None = None, until: str | None = None, ascending: bool = False) -> list:
+    """
+    게시판 글을 created_at 순서로 조회합니다. (기본: 최신순)
+    since(이상)/until(미만)은 정렬 키 조건으로 처리되어 범위 안의 글만 읽습니다.
+    cursor(이전 페이지 마지막 글의 created_at)가 있으면 그 다음 글부터 가져옵니다.
+    같은 조건의 동시 요청은 DB 호출 하나로 병합됩니다.
+    """
     if posts_table is None: return []
+    # 조회 실패는 병합기 밖에서 빈 목록으로 바꿔야 실패 결과가 캐시되지 않습니다.
     try:
-        response = posts_table.query(
-            IndexName='Type-CreatedAt-Index',
-            KeyConditionExpression=Key('post_type').eq(post_type),
-            ScanIndexForward=False
+        return read_coalescer.do(
+            ("posts", post_type, limit, cursor, since, until, ascending),
+            lambda: _fetch_posts(post_type, limit, cursor, since, until, ascending)
         )
-        return response.get('Items', [])
     except ClientError as e:
         print(f"DynamoDB Query Error: {e}")
         return []
 
-def get_post_detail(post_id: str) -> dict | None:
-    if posts_table is None: return None
+def _fetch_posts(post_type: str, limit: int | None, cursor: str | None,
+                 since: str | None, until: str | None, ascending: bool) -> list:
+    if POST_TYPE_SHARDS > 0 and POST_SHARD_READS:
+        return _get_posts_sharded(post_type, limit, cursor, since, until, ascending)
+
+    try:
+        return _query_by_created_at(
+            POST_TYPE_INDEX_NAME, Key('post_type').eq(post_type),
+            limit, cursor, since, until, ascending
+        )
+    except ClientError as e:
+        if POST_TYPE_SHARDS <= 0 or e.response['Error']['Code'] not in ('ValidationException', 'ResourceNotFoundException'):
+            raise
+    # 샤딩 전환 후 Type-CreatedAt-Index를 삭제한 환경: 샤딩 인덱스로 대체
+    print(f"⚠️ {POST_TYPE_INDEX_NAME} 인덱스가 없어 {POST_SHARD_INDEX_NAME}로 조회합니다.")
+    return _get_posts_sharded(post_type, limit, cursor, since, until, ascending)
+
+def _get_posts_sharded(post_type: str, limit: int | None, cursor: str | None,
+                       since: str | None, until: str | None, ascending: bool) -> list:
+    """
+    모든 샤드를 병렬로 조회(scatter)한 뒤 created_at 기준 k-way 병합(gather)합니다.
+    각 샤드는 이미 정렬되어 있으므로 샤드마다 최대 limit개만 읽으면 충분합니다.
+    """
+    def query_shard(shard_no: int) -> list:
+        return _query_by_created_at(
+            POST_SHARD_INDEX_NAME, Key('post_type_shard').eq(f"{post_type}#{shard_no}"),
+            limit, cursor, since, until, ascending
+        )
+
+    shard_results = list(_shard_pool.map(query_shard, range(POST_TYPE_SHARDS)))
+    merged = heapq.merge(*shard_results, key=lambda x: x['created_at'], reverse=not ascending)
+    return list(islice(merged, limit)) if limit is not None else list(merged)
+
+def _add_pending_views(post_id: str, count: int):
+    with _views_lock:
+        _pending_views[post_id] = _pending_views.get(post_id, 0) + count
+
+def _take_pending_views(post_id: str) -> int:
+    with _views_lock:
+        return _pending_views.pop(post_id, 0)
+
+def _increment_views(post_id: str, views: int) -> dict | None:
+    """조회수를 views만큼 올리고 갱신된 게시글을 반환합니다. (게시글이 없으면 None)"""
     try:
         response = posts_table.update_item(
             Key={'post_id': post_id},
             UpdateExpression="SET view_count = view_count + :inc",
-            ExpressionAttributeValues={':inc': 1},
+            ExpressionAttributeValues={':inc': views},
             ConditionExpression="attribute_exists(post_id)",
             ReturnValues="ALL_NEW"
         )
-        return response.get('Attributes')
+        post = response.get('Attributes')
+        trending.record_view(post, views)
+        return post
     except ClientError as e:
         if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
             return None
+        # 일시적 오류면 다음 반영 때 다시 시도하도록 되돌려 놓음
+        _add_pending_views(post_id, views)
+        raise
+
+def get_post_detail(post_id: str) -> dict | None:
+    """
+    게시글 상세 조회 (조회수 +1).
+    같은 글의 동시 조회는 DB 호출 하나로 병합되고, 그동안 쌓인 조회수는 한 번에 더해집니다.
+    """
+    if posts_table is None: return None
+    _add_pending_views(post_id, 1)
+    try:
+        return read_coalescer.do(("post_detail", post_id), lambda: _fetch_post_detail(post_id))
+    except ClientError as e:
         print(f"DynamoDB Get Detail Error: {e}")
         return None
 
+def _fetch_post_detail(post_id: str) -> dict | None:
+    views = _take_pending_views(post_id)
+    if views == 0:
+        return posts_table.get_item(Key={'post_id': post_id}).get('Item')
+    return _increment_views(post_id, views)
+
+def flush_pending_views():
+    """캐시된 상세 조회로 쌓인 조회수를 DB에 반영합니다. (주기적으로 호출)"""
+    with _views_lock:
+        pending = dict(_pending_views)
+        _pending_views.clear()
+    for post_id, views in pending.items():
+        try:
+            _increment_views(post_id, views)
+        except ClientError as e:
+            print(f"View Count Flush Error: {e}")
+
+def get_post(post_id: str) -> dict | None:
+    """
+    게시글을 조회수 증가 없이 최신 상태로 읽습니다. (수정/삭제 전 권한 확인용)
+    """
+    if posts_table is None: return None
+    try:
+        response = posts_table.get_item(Key={'post_id': post_id}, ConsistentRead=True)
+        return response.get('Item')
+    except ClientError as e:
+        print(f"DynamoDB GetItem Error: {e}")
+        return None
+
+def _delete_post(post_id: str, user_id: str):
+    """작성자 조건부로 게시글을 삭제합니다. 실패하면 ClientError를 그대로 올립니다."""
+    posts_table.delete_item(
+        Key={'post_id': post_id},
+        ConditionExpression="user_id = :uid",
+        ExpressionAttributeValues={":uid": user_id}
+    )
+    trending.remove_post(post_id)
+    read_coalescer.forget("posts")
+    read_coalescer.forget("post_detail", post_id)
+
+def get_existing_post_ids(post_ids: list) -> set | None:
+    """
+    post_ids 중 아직 존재하는 게시글 id 집합을 반환합니다. (인기글 후보 정리용, 조회 실패 시 None)
+    끝내 조회하지 못한 id는 삭제 여부를 알 수 없으므로 존재하는 것으로 취급합니다.
+    """
+    if posts_table is None: return None
+    if not post_ids: return set()
+    try:
+        found, unresolved = _batch_get(POSTS_TABLE_NAME, 'post_id', post_ids, 'post_id')
+        return set(found) | unresolved
+    except ClientError as e:
+        print(f"❌ Post BatchGet Error: {e}")
+        return None
+
 def delete_post_item(post_id: str, user_id: str) -> bool:
     if posts_table is None: return False
     try:
-        posts_table.delete_item(
-            Key={'post_id': post_id},
-            ConditionExpression="user_id = :uid",
-            ExpressionAttributeValues={":uid": user_id}
-        )
+        _delete_post(post_id, user_id)
         return True
     except ClientError as e:
         return False
@@ -108,6 +334,10 @@ def update_post_item(post_id: str, user_id: str, title: str, content: str, post_
             ':uid': user_id
         }
 
+        if POST_TYPE_SHARDS > 0:
+            update_expr += ", post_type_shard=:s"
+            expr_values[':s'] = post_shard_key(post_type, post_id)
+
         if file_urls is not None:
             update_expr += ", file_urls=:f"
             expr_values[':f'] = file_urls
@@ -119,7 +349,11 @@ def update_post_item(post_id: str, user_id: str, title: str, content: str, post_
             ConditionExpression="user_id = :uid",
             ReturnValues="ALL_NEW"
         )
-        return response.get('Attributes')
+        post = response.get('Attributes')
+        trending.update_post(post)
+        read_coalescer.forget("posts")
+        read_coalescer.forget("post_detail", post_id)
+        return post
     except ClientError as e:
         print(f"Update Error: {e}")
         return None
@@ -143,22 +377,15 @@ def search_posts(keyword: str) -> list:
         return []
 
 #  내가 쓴 글 조회 로직 (MyPage)
-def get_posts_by_user(user_id: str) -> list:
+def get_posts_by_user(user_id: str, limit: int | None = None, cursor: str | None = None,
+                      since: str | None = None, until: str | None = None, ascending: bool = False) -> list:
     """
-    특정 유저(user_id)가 작성한 모든 게시글을 조회하고 최신순으로 정렬합니다.
+    특정 유저(user_id)가 작성한 게시글을 created_at 순서로 조회합니다. (기본: 최신순)
+    User-CreatedAt-Index GSI를 Query하므로 읽기 비용이 결과 크기에 비례합니다.
     """
     if posts_table is None: return []
     try:
-        # user_id가 일치하는 데이터만 Scan
-        response = posts_table.scan(
-            FilterExpression=Attr('user_id').eq(user_id)
-        )
-        items = response.get('Items', [])
-        
-        # 가져온 데이터를 created_at 기준 내림차순(최신순) 정렬
-        items.sort(key=lambda x: x['created_at'], reverse=True)
-        return items
-        
+        return query_posts_by_user(user_id, limit, cursor, since, until, ascending)
     except ClientError as e:
         print(f"My Posts Query Error: {e}")
         return []
@@ -166,6 +393,46 @@ def get_posts_by_user(user_id: str) -> list:
         print(f"My Posts Unexpected Error: {e}")
         return []
 
+def query_posts_by_user(user_id: str, limit: int | None = None, cursor: str | None = None,
+                        since: str | None = None, until: str | None = None, ascending: bool = False) -> list:
+    """
+    get_posts_by_user와 같지만 조회 실패를 빈 목록으로 바꾸지 않고 예외를 그대로 올립니다.
+    (결과가 비었는지와 조회에 실패했는지를 구분해야 하는 정리 작업용)
+    """
+    try:
+        return _query_by_created_at(
+            USER_POSTS_INDEX_NAME, Key('user_id').eq(user_id),
+            limit, cursor, since, until, ascending
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] not in ('ValidationException', 'ResourceNotFoundException'):
+            raise
+    # 인덱스가 아직 없는 환경: 기존 방식(Scan)으로 대체
+    # (python -m app.tools.create_user_posts_index 로 인덱스를 만들면 Query로 전환됩니다)
+    print(f"⚠️ {USER_POSTS_INDEX_NAME} 인덱스가 없어 Scan으로 조회합니다.")
+    return _scan_posts_by_user(user_id, limit, cursor, since, until, ascending)
+
+def _scan_posts_by_user(user_id: str, limit: int | None, cursor: str | None,
+                        since: str | None, until: str | None, ascending: bool) -> list:
+    items = []
+    scan_kwargs = {'FilterExpression': Attr('user_id').eq(user_id)}
+    while True:
+        response = posts_table.scan(**scan_kwargs)
+        items.extend(response.get('Items', []))
+        if not response.get('LastEvaluatedKey'):
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def in_range(created_at: str) -> bool:
+        if since and created_at < since: return False
+        if until and created_at >= until: return False
+        if cursor and (created_at <= cursor if ascending else created_at >= cursor): return False
+        return True
+
+    # 가져온 데이터를 created_at 기준으로 정렬
+    items = sorted((x for x in items if in_range(x['created_at'])), key=lambda x: x['created_at'], reverse=not ascending)
+    return items[:limit] if limit is not None else items
+
 # ---------------------------------------------------------
 # 2. 댓글(Feedback) 관련 로직
 # ---------------------------------------------------------
@@ -184,11 +451,15 @@ def create_comment(post_id: str, user_id: str, nickname: str, content: str) -> d
             'content': content
         }
         comments_table.put_item(Item=item)
-        posts_table.update_item(
+        response = posts_table.update_item(
             Key={'post_id': post_id},
             UpdateExpression="SET feedback_count = feedback_count + :inc",
-            ExpressionAttributeValues={':inc': 1}
+            ExpressionAttributeValues={':inc': 1},
+            ReturnValues="ALL_NEW"
         )
+        trending.record_comment(response.get('Attributes'))
+        read_coalescer.forget("comments", post_id)
+        read_coalescer.forget("post_detail", post_id)
         return item
     except ClientError as e:
         print(f"❌ Comment Create Error: {e}")
@@ -197,42 +468,111 @@ def create_comment(post_id: str, user_id: str, nickname: str, content: str) -> d
 def get_comments(post_id: str) -> list:
     if comments_table is None: return []
     try:
-        response = comments_table.query(
-            KeyConditionExpression=Key('post_id').eq(post_id),
-            ScanIndexForward=True 
-        )
-        return response.get('Items', [])
+        return read_coalescer.do(("comments", post_id), lambda: _fetch_comments(post_id))
     except ClientError as e:
         print(f"❌ Comment Query Error: {e}")
         return []
 
+def _fetch_comments(post_id: str) -> list:
+    response = comments_table.query(
+        KeyConditionExpression=Key('post_id').eq(post_id),
+        ScanIndexForward=True 
+    )
+    return response.get('Items', [])
+
+def _delete_comment(post_id: str, comment_id: str, user_id: str):
+    """작성자 조건부로 댓글을 삭제하고 게시글 댓글 수를 줄입니다. 실패하면 ClientError를 그대로 올립니다."""
+    comments_table.delete_item(
+        Key={'post_id': post_id, 'created_at': comment_id},
+        ConditionExpression="user_id = :uid",
+        ExpressionAttributeValues={":uid": user_id}
+    )
+    read_coalescer.forget("comments", post_id)
+    read_coalescer.forget("post_detail", post_id)
+    response = posts_table.update_item(
+        Key={'post_id': post_id},
+        UpdateExpression="SET feedback_count = feedback_count - :dec",
+        # 게시글이 이미 삭제됐으면 빈 항목이 새로 생기지 않도록 건너뜀
+        ConditionExpression="attribute_exists(post_id)",
+        ExpressionAttributeValues={':dec': 1},
+        ReturnValues="ALL_NEW"
+    )
+    trending.update_post(response.get('Attributes'))
+
 def delete_comment(post_id: str, comment_id: str, user_id: str) -> bool:
     if comments_table is None or posts_table is None: return False
     try:
-        comments_table.delete_item(
-            Key={'post_id': post_id, 'created_at': comment_id},
-            ConditionExpression="user_id = :uid",
-            ExpressionAttributeValues={":uid": user_id}
-        )
-        posts_table.update_item(
-            Key={'post_id': post_id},
-            UpdateExpression="SET feedback_count = feedback_count - :dec",
-            ExpressionAttributeValues={':dec': 1}
-        )
+        _delete_comment(post_id, comment_id, user_id)
         return True
     except ClientError: return False
 
-def delete_comments_by_post_id(post_id: str):
-    if comments_table is None: return
+def delete_comments_by_post_id(post_id: str) -> bool:
+    """게시글의 모든 댓글을 삭제합니다. (페이지 단위 반복, 여러 번 호출해도 안전)"""
+    if comments_table is None: return False
+    try:
+        deleted = 0
+        query_kwargs = {
+            'KeyConditionExpression': Key('post_id').eq(post_id),
+            'ProjectionExpression': 'post_id, created_at',
+        }
+        while True:
+            response = comments_table.query(**query_kwargs)
+            comments = response.get('Items', [])
+            with comments_table.batch_writer() as batch:
+                for comment in comments:
+                    batch.delete_item(Key={'post_id': post_id, 'created_at': comment['created_at']})
+            deleted += len(comments)
+            if not response.get('LastEvaluatedKey'):
+                break
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        read_coalescer.forget("comments", post_id)
+        if deleted:
+            print(f"🗑️ 댓글 {deleted}개 삭제 완료")
+        return True
+    except ClientError as e:
+        print(f"❌ Comment Cascade Delete Error: {e}")
+        return False
+
+def get_comments_by_user(user_id: str) -> list:
+    """
+    특정 유저가 작성한 모든 댓글을 조회합니다. (회원 탈퇴 정리 작업 전용)
+    댓글 테이블에 작성자 인덱스가 없어 Scan을 사용하므로 백그라운드에서만 호출합니다.
+    """
+    if comments_table is None: return []
+    items = []
+    scan_kwargs = {
+        'FilterExpression': Attr('user_id').eq(user_id),
+        'ProjectionExpression': 'post_id, created_at',
+    }
+    while True:
+        response = comments_table.scan(**scan_kwargs)
+        items.extend(response.get('Items', []))
+        if not response.get('LastEvaluatedKey'):
+            return items
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+# ---------------------------------------------------------
+# 2-1. 회원 탈퇴 정리 작업 전용 삭제 (이미 삭제된 항목은 성공, 그 외 실패는 예외로 올려 재시도)
+# ---------------------------------------------------------
+
+def _is_condition_failed(error: ClientError) -> bool:
+    return error.response['Error']['Code'] == 'ConditionalCheckFailedException'
+
+def purge_post_item(post_id: str, user_id: str):
+    """게시글을 삭제합니다. 이미 없으면 아무것도 하지 않고, 다른 오류는 ClientError로 올립니다."""
     try:
-        response = comments_table.query(KeyConditionExpression=Key('post_id').eq(post_id))
-        comments = response.get('Items', [])
-        if not comments: return
-        with comments_table.batch_writer() as batch:
-            for comment in comments:
-                batch.delete_item(Key={'post_id': post_id, 'created_at': comment['created_at']})
-        print(f"🗑️ 댓글 {len(comments)}개 삭제 완료")
-    except Exception: pass
+        _delete_post(post_id, user_id)
+    except ClientError as e:
+        if not _is_condition_failed(e):
+            raise
+
+def purge_comment(post_id: str, comment_id: str, user_id: str):
+    """댓글을 삭제합니다. 이미 없으면(또는 게시글이 먼저 삭제됐으면) 성공으로 보고, 다른 오류는 ClientError로 올립니다."""
+    try:
+        _delete_comment(post_id, comment_id, user_id)
+    except ClientError as e:
+        if not _is_condition_failed(e):
+            raise
 
 # ---------------------------------------------------------
 # 3. 회원 관리(Auth) 관련 로직
@@ -271,6 +611,46 @@ def get_user(email):
         return response.get('Item')
     except ClientError: return None
 
+def _batch_get(table_name: str, key_name: str, ids: list, projection: str) -> tuple[dict, set]:
+    """
+    BatchGetItem으로 ids를 요청당 최대 100개씩 조회합니다. (ClientError는 그대로 올림)
+    처리되지 않은 키(UnprocessedKeys)는 지터를 섞은 지수 백오프로 최대 _BATCH_GET_MAX_ATTEMPTS번까지 재요청하고,
+    그래도 남으면 그때까지 조회된 항목만 반환합니다.
+    반환값: ({ id: 항목 }, 끝내 조회하지 못한 id 집합)
+    """
+    found, unresolved = {}, set()
+    for i in range(0, len(ids), 100):
+        request = {table_name: {
+            'Keys': [{key_name: value} for value in ids[i:i + 100]],
+            'ProjectionExpression': projection,
+        }}
+        for attempt in range(_BATCH_GET_MAX_ATTEMPTS):
+            if attempt > 0:
+                time.sleep(random.uniform(0, min(_BATCH_GET_BACKOFF_MAX, _BATCH_GET_BACKOFF_BASE * 2 ** attempt)))
+            response = dynamodb.batch_get_item(RequestItems=request)
+            for item in response.get('Responses', {}).get(table_name, []):
+                found[item[key_name]] = item
+            request = response.get('UnprocessedKeys')
+            if not request:
+                break
+        else:
+            unresolved.update(key[key_name] for key in request[table_name]['Keys'])
+            print(f"⚠️ BatchGet({table_name}): 처리되지 않은 키 {len(request[table_name]['Keys'])}개를 건너뜁니다.")
+    return found, unresolved
+
+def batch_get_users(emails: list) -> tuple[dict, set] | None:
+    """
+    여러 유저를 BatchGetItem으로 한 번에 조회합니다. (처리되지 않은 키는 백오프 후 재요청)
+    반환값: ({ email: {'email': ..., 'nickname': ...} }, 끝내 조회하지 못한 email 집합) (조회 실패 시 None)
+    """
+    if not users_table: return None
+    if not emails: return {}, set()
+    try:
+        return _batch_get(USERS_TABLE_NAME, 'email', emails, 'email, nickname')
+    except ClientError as e:
+        print(f"❌ User BatchGet Error: {e}")
+        return None
+
 def delete_user(email):
     if not users_table: return False
     try:
@@ -0,0 +1,127 @@
+# app/services/idempotency.py
+# Idempotency-Key 기반 중복 요청 방지 (클라이언트 재시도 시 처음 결과를 그대로 반환)
+#
+# 1. 첫 요청: 조건부 쓰기(attribute_not_exists)로 키를 선점하고 post_id를 함께 기록
+# 2. 처리 완료: 응답 본문을 저장 (TTL이 지나면 DynamoDB가 자동 삭제)
+# 3. 재시도: 저장된 응답을 그대로 반환 (S3 업로드/DB 저장을 다시 하지 않음)
+
+import hashlib
+import json
+import time
+import uuid
+from botocore.exceptions import ClientError
+from ..config import IDEMPOTENCY_TABLE_NAME, IDEMPOTENCY_TTL_HOURS, IDEMPOTENCY_LOCK_SECONDS
+from .aws_client import get_resource
+
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_COMPLETED = "completed"
+
+dynamodb = get_resource('dynamodb')
+idempotency_table = dynamodb.Table(IDEMPOTENCY_TABLE_NAME)
+
+def create_idempotency_table_if_not_exists():
+    try:
+        existing_tables = [t.name for t in dynamodb.tables.all()]
+        if IDEMPOTENCY_TABLE_NAME in existing_tables:
+            print(f"ℹ 멱등성 테이블({IDEMPOTENCY_TABLE_NAME})이 이미 존재합니다.")
+            return
+        print(f"🔨 멱등성 테이블({IDEMPOTENCY_TABLE_NAME}) 생성 중...")
+        table = dynamodb.create_table(
+            TableName=IDEMPOTENCY_TABLE_NAME,
+            KeySchema=[{'AttributeName': 'idempotency_key', 'KeyType': 'HASH'}],
+            AttributeDefinitions=[{'AttributeName': 'idempotency_key', 'AttributeType': 'S'}],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        table.wait_until_exists()
+        dynamodb.meta.client.update_time_to_live(
+            TableName=IDEMPOTENCY_TABLE_NAME,
+            TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'expires_at'}
+        )
+        print("✅ 멱등성 테이블 생성 완료")
+    except Exception as e: print(f"❌ 멱등성 테이블 생성 실패: {e}")
+
+def request_fingerprint(*fields) -> str:
+    """같은 키로 다른 내용을 보내는 실수를 막기 위한 요청 요약값"""
+    return hashlib.sha256(json.dumps(fields, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def begin(scope: str, key: str, fingerprint: str) -> dict:
+    """
+    키를 선점합니다. 반환값의 status로 다음 동작을 결정합니다.
+      - "started": 처음 요청 (record['post_id']로 처리 진행)
+                   잠금이 만료된 기록을 이어받은 경우 resumed=True (이전 시도가 게시글을 이미 저장했을 수 있음)
+      - "completed": 이미 처리됨 (record['response']를 그대로 반환)
+      - "in_progress": 같은 요청이 아직 처리 중
+      - "mismatch": 같은 키로 다른 내용의 요청
+    """
+    record_key = f"{scope}#{key}"
+    now = int(time.time())
+    record = {
+        'idempotency_key': record_key,
+        'status': STATUS_IN_PROGRESS,
+        'post_id': str(uuid.uuid4()),
+        'fingerprint': fingerprint,
+        'locked_until': now + IDEMPOTENCY_LOCK_SECONDS,
+        'expires_at': now + IDEMPOTENCY_TTL_HOURS * 3600,
+    }
+    try:
+        idempotency_table.put_item(
+            Item=record,
+            # TTL 삭제는 늦게 일어날 수 있으므로 만료된 기록은 없는 것으로 취급
+            ConditionExpression="attribute_not_exists(idempotency_key) OR expires_at < :now",
+            ExpressionAttributeValues={':now': now}
+        )
+        return {'status': "started", 'record': record, 'resumed': False}
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            raise
+
+    existing = idempotency_table.get_item(Key={'idempotency_key': record_key}, ConsistentRead=True).get('Item')
+    if existing is None:
+        # 그 사이 삭제(release)된 경우: 처음부터 다시 시도
+        return begin(scope, key, fingerprint)
+    if existing['fingerprint'] != fingerprint:
+        return {'status': "mismatch", 'record': existing}
+    if existing['status'] == STATUS_COMPLETED:
+        return {'status': "completed", 'record': dict(existing, response=json.loads(existing['response']))}
+
+    # 처리 중이던 서버가 죽어 잠금이 만료됐으면 같은 post_id로 이어서 처리
+    if existing['locked_until'] < now:
+        try:
+            idempotency_table.update_item(
+                Key={'idempotency_key': record_key},
+                UpdateExpression="SET locked_until = :lock",
+                ConditionExpression="#s = :in_progress AND locked_until = :prev",
+                ExpressionAttributeNames={'#s': 'status'},
+                ExpressionAttributeValues={
+                    ':lock': now + IDEMPOTENCY_LOCK_SECONDS,
+                    ':in_progress': STATUS_IN_PROGRESS,
+                    ':prev': existing['locked_until'],
+                }
+            )
+            return {'status': "started", 'record': existing, 'resumed': True}
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+    return {'status': "in_progress", 'record': existing}
+
+def complete(scope: str, key: str, response: dict):
+    """처리 결과를 저장합니다. 이후 같은 키의 재시도에는 이 응답이 반환됩니다."""
+    try:
+        idempotency_table.update_item(
+            Key={'idempotency_key': f"{scope}#{key}"},
+            UpdateExpression="SET #s = :completed, #r = :response",
+            ExpressionAttributeNames={'#s': 'status', '#r': 'response'},
+            ExpressionAttributeValues={
+                ':completed': STATUS_COMPLETED,
+                ':response': json.dumps(response, ensure_ascii=False, default=str),
+            }
+        )
+    except ClientError as e:
+        print(f"❌ Idempotency Complete Error: {e}")
+
+def release(scope: str, key: str):
+    """처리에 실패하면 기록을 지워 클라이언트가 같은 키로 다시 시도할 수 있게 합니다."""
+    try:
+        idempotency_table.delete_item(Key={'idempotency_key': f"{scope}#{key}"})
+    except ClientError as e:
+        print(f"❌ Idempotency Release Error: {e}")
@@ -0,0 +1,387 @@
+# app/services/jobs.py
+# 백그라운드 작업(Job) 큐: 영속 저장소 + 재시도/백오프 + 워커 스레드
+#
+# 요청 처리 중에는 작업을 저장(enqueue)만 하고 바로 응답합니다.
+# 워커 스레드가 저장소에서 실행할 때가 된 작업을 가져와(claim) 핸들러를 실행하며,
+# 실패하면 지수 백오프로 다시 예약하고, 서버가 죽어도 lease가 끝나면 다른 워커가 이어서 실행합니다.
+# 실행 중에는 lease를 주기적으로 연장하므로 오래 걸리는 작업도 짧은 lease로 돌릴 수 있습니다.
+# 작업 종류는 큐(queue)에 속하고, 큐마다 워커 스레드를 따로 둡니다. (내보내기가 삭제 정리 작업을 막지 않도록)
+# 같은 작업이 두 번 실행될 수 있으므로 핸들러는 반드시 멱등(idempotent)해야 합니다.
+
+import json
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from boto3.dynamodb.conditions import Key, Attr
+from botocore.exceptions import ClientError
+from ..config import (
+    JOBS_BACKEND, JOBS_DB_PATH, JOBS_TABLE_NAME,
+    JOB_WORKERS, JOB_QUEUE_WORKERS, JOB_POLL_INTERVAL, JOB_MAX_ATTEMPTS,
+    JOB_BACKOFF_BASE, JOB_BACKOFF_MAX, JOB_LEASE_SECONDS, JOB_RETENTION_DAYS,
+)
+from .aws_client import get_resource
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+JOBS_STATUS_INDEX_NAME = "Status-RunAt-Index"
+
+DEFAULT_QUEUE = "default"
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+# ---------------------------------------------------------
+# 1. 작업 저장소
+#    run_at: pending이면 실행 예정 시각, running이면 lease 만료 시각 (ms)
+#    → "status가 pending/running 이고 run_at <= 현재" 인 작업이 실행 대상
+#    due()의 job_types/exclude: 해당 작업 종류만(또는 해당 종류를 뺀 나머지만) 가져옴 (None이면 전체)
+# ---------------------------------------------------------
+
+class SqliteJobStore:
+    """로컬 개발용 저장소 (SQLite 파일)"""
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " job_id TEXT PRIMARY KEY, job_type TEXT, payload TEXT, status TEXT,"
+                " run_at INTEGER, attempts INTEGER, last_error TEXT, updated_at INTEGER)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status_run_at ON jobs (status, run_at)")
+
+    def insert(self, job: dict) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job['job_id'], job['job_type'], job['payload'], job['status'],
+                 job['run_at'], job['attempts'], None, _now_ms())
+            )
+            return cursor.rowcount == 1
+
+    def get(self, job_id: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_id, job_type, payload, status, run_at, attempts, last_error FROM jobs WHERE job_id = ?",
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ('job_id', 'job_type', 'payload', 'status', 'run_at', 'attempts', 'last_error')
+        return dict(zip(keys, row))
+
+    def due(self, now: int, limit: int, job_types: tuple | None = None, exclude: bool = False) -> list:
+        if job_types is not None and not job_types and not exclude:
+            return []
+        job_types = job_types or ()
+        type_filter = ""
+        if job_types:
+            placeholders = ", ".join("?" for _ in job_types)
+            type_filter = f" AND job_type {'NOT IN' if exclude else 'IN'} ({placeholders})"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id, job_type, payload, status, run_at, attempts FROM jobs"
+                f" WHERE status IN (?, ?) AND run_at <= ?{type_filter} ORDER BY run_at LIMIT ?",
+                (STATUS_PENDING, STATUS_RUNNING, now, *job_types, limit)
+            ).fetchall()
+        keys = ('job_id', 'job_type', 'payload', 'status', 'run_at', 'attempts')
+        return [dict(zip(keys, row)) for row in rows]
+
+    def claim(self, job: dict, lease_until: int) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, run_at = ?, attempts = attempts + 1, updated_at = ?"
+                " WHERE job_id = ? AND status = ? AND run_at = ?",
+                (STATUS_RUNNING, lease_until, _now_ms(), job['job_id'], job['status'], job['run_at'])
+            )
+            return cursor.rowcount == 1
+
+    def renew(self, job_id: str, lease_until: int) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET run_at = ?, updated_at = ? WHERE job_id = ? AND status = ?",
+                (lease_until, _now_ms(), job_id, STATUS_RUNNING)
+            )
+            return cursor.rowcount == 1
+
+    def finish(self, job_id: str, status: str, run_at: int = 0, error: str | None = None):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, run_at = ?, last_error = ?, updated_at = ? WHERE job_id = ?",
+                (status, run_at, error, _now_ms(), job_id)
+            )
+
+
+class DynamoJobStore:
+    """DynamoDB 저장소 (PK: job_id, GSI: status + run_at)"""
+
+    def __init__(self, table_name: str):
+        self._dynamodb = get_resource('dynamodb')
+        self._table_name = table_name
+        self.table = self._dynamodb.Table(table_name)
+
+    def create_table_if_not_exists(self):
+        try:
+            existing_tables = [t.name for t in self._dynamodb.tables.all()]
+            if self._table_name in existing_tables:
+                print(f"ℹ 작업 테이블({self._table_name})이 이미 존재합니다.")
+                return
+            print(f"🔨 작업 테이블({self._table_name}) 생성 중...")
+            table = self._dynamodb.create_table(
+                TableName=self._table_name,
+                KeySchema=[{'AttributeName': 'job_id', 'KeyType': 'HASH'}],
+                AttributeDefinitions=[
+                    {'AttributeName': 'job_id', 'AttributeType': 'S'},
+                    {'AttributeName': 'status', 'AttributeType': 'S'},
+                    {'AttributeName': 'run_at', 'AttributeType': 'N'},
+                ],
+                GlobalSecondaryIndexes=[{
+                    'IndexName': JOBS_STATUS_INDEX_NAME,
+                    'KeySchema': [
+                        {'AttributeName': 'status', 'KeyType': 'HASH'},
+                        {'AttributeName': 'run_at', 'KeyType': 'RANGE'},
+                    ],
+                    'Projection': {'ProjectionType': 'ALL'},
+                }],
+                BillingMode='PAY_PER_REQUEST'
+            )
+            table.wait_until_exists()
+            # 끝난 작업 기록은 expires_at 이후 자동 삭제
+            self._dynamodb.meta.client.update_time_to_live(
+                TableName=self._table_name,
+                TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'expires_at'}
+            )
+            print("✅ 작업 테이블 생성 완료")
+        except Exception as e: print(f"❌ 작업 테이블 생성 실패: {e}")
+
+    def insert(self, job: dict) -> bool:
+        try:
+            self.table.put_item(Item=job, ConditionExpression='attribute_not_exists(job_id)')
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise
+
+    def get(self, job_id: str) -> dict | None:
+        # 방금 추가한 작업도 바로 보이도록 강한 일관성 읽기
+        item = self.table.get_item(Key={'job_id': job_id}, ConsistentRead=True).get('Item')
+        return self._normalize(item) if item else None
+
+    def due(self, now: int, limit: int, job_types: tuple | None = None, exclude: bool = False) -> list:
+        if job_types is not None and not job_types and not exclude:
+            return []
+        jobs = []
+        for status in (STATUS_PENDING, STATUS_RUNNING):
+            query_kwargs = {
+                'IndexName': JOBS_STATUS_INDEX_NAME,
+                'KeyConditionExpression': Key('status').eq(status) & Key('run_at').lte(now),
+            }
+            if job_types:
+                type_cond = Attr('job_type').is_in(list(job_types))
+                query_kwargs['FilterExpression'] = ~type_cond if exclude else type_cond
+            # FilterExpression은 Limit 이후에 적용되므로 limit개를 모을 때까지 페이지를 따라감
+            found = []
+            while len(found) < limit:
+                response = self.table.query(**query_kwargs)
+                found.extend(self._normalize(item) for item in response.get('Items', []))
+                if not response.get('LastEvaluatedKey'):
+                    break
+                query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            jobs.extend(found[:limit])
+        return sorted(jobs, key=lambda job: job['run_at'])[:limit]
+
+    def claim(self, job: dict, lease_until: int) -> bool:
+        try:
+            self.table.update_item(
+                Key={'job_id': job['job_id']},
+                UpdateExpression="SET #s = :running, run_at = :lease, attempts = attempts + :one",
+                ConditionExpression="#s = :status AND run_at = :run_at",
+                ExpressionAttributeNames={'#s': 'status'},
+                ExpressionAttributeValues={
+                    ':running': STATUS_RUNNING, ':lease': lease_until, ':one': 1,
+                    ':status': job['status'], ':run_at': job['run_at'],
+                }
+            )
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise
+
+    def renew(self, job_id: str, lease_until: int) -> bool:
+        try:
+            self.table.update_item(
+                Key={'job_id': job_id},
+                UpdateExpression="SET run_at = :lease",
+                ConditionExpression="#s = :running",
+                ExpressionAttributeNames={'#s': 'status'},
+                ExpressionAttributeValues={':lease': lease_until, ':running': STATUS_RUNNING}
+            )
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise
+
+    def finish(self, job_id: str, status: str, run_at: int = 0, error: str | None = None):
+        update_expr = "SET #s = :status, run_at = :run_at, last_error = :error"
+        values = {':status': status, ':run_at': run_at, ':error': error}
+        if status in (STATUS_DONE, STATUS_FAILED):
+            update_expr += ", expires_at = :expires"
+            values[':expires'] = int(time.time()) + JOB_RETENTION_DAYS * 86400
+        self.table.update_item(
+            Key={'job_id': job_id},
+            UpdateExpression=update_expr,
+            ExpressionAttributeNames={'#s': 'status'},
+            ExpressionAttributeValues=values
+        )
+
+    @staticmethod
+    def _normalize(item: dict) -> dict:
+        # DynamoDB 숫자(Decimal)를 int로 변환
+        return dict(item, run_at=int(item['run_at']), attempts=int(item['attempts']))
+
+
+store = SqliteJobStore(JOBS_DB_PATH) if JOBS_BACKEND == "local" else DynamoJobStore(JOBS_TABLE_NAME)
+
+# ---------------------------------------------------------
+# 2. 핸들러 등록 / 작업 추가
+# ---------------------------------------------------------
+
+_handlers = {}
+_lease_seconds = {}
+# 기본 큐가 아닌 작업 종류 { job_type: queue }
+_queues = {}
+_wake = {DEFAULT_QUEUE: threading.Event()}
+
+def job_handler(job_type: str, lease_seconds: int | None = None, queue: str = DEFAULT_QUEUE):
+    """
+    작업 종류별 실행 함수를 등록하는 데코레이터 (payload의 키가 인자로 전달됨)
+    lease_seconds: 실행 중 lease 길이 (실행 중에는 1/3마다 연장되므로 서버가 죽었을 때 재시도까지의 대기 시간)
+    queue: 이 작업을 실행할 워커 큐 (오래 걸리는 작업은 별도 큐로 분리해 다른 작업을 막지 않도록)
+    """
+    def decorator(func):
+        _handlers[job_type] = func
+        if lease_seconds is not None:
+            _lease_seconds[job_type] = lease_seconds
+        if queue != DEFAULT_QUEUE:
+            _queues[job_type] = queue
+            _wake.setdefault(queue, threading.Event())
+        return func
+    return decorator
+
+def enqueue(job_type: str, payload: dict, job_id: str | None = None) -> str:
+    """
+    작업을 저장하고 job_id를 반환합니다.
+    같은 job_id의 작업이 이미 있으면 새로 만들지 않습니다. (중복 요청에도 한 번만 실행)
+    """
+    job_id = job_id or f"{job_type}:{uuid.uuid4()}"
+    job = {
+        'job_id': job_id,
+        'job_type': job_type,
+        'payload': json.dumps(payload, ensure_ascii=False, default=str),
+        'status': STATUS_PENDING,
+        'run_at': _now_ms(),
+        'attempts': 0,
+    }
+    if store.insert(job):
+        _wake[_queues.get(job_type, DEFAULT_QUEUE)].set()
+    return job_id
+
+def get_job(job_id: str) -> dict | None:
+    return store.get(job_id)
+
+# ---------------------------------------------------------
+# 3. 실행 (워커)
+# ---------------------------------------------------------
+
+def _renew_lease(job_id: str, lease: int, done: threading.Event):
+    """작업이 끝날 때까지 lease의 1/3마다 lease를 연장합니다. (서버가 죽으면 연장이 멈춰 lease 후 재시도됨)"""
+    while not done.wait(lease / 3):
+        try:
+            if not store.renew(job_id, _now_ms() + lease * 1000):
+                print(f"⚠️ Job Lease Lost ({job_id})")
+                return
+        except Exception as e:
+            print(f"⚠️ Job Lease Renew Error ({job_id}): {e}")
+
+def _execute(job: dict, lease: int):
+    attempts = job['attempts'] + 1
+    handler = _handlers.get(job['job_type'])
+    done = threading.Event()
+    threading.Thread(target=_renew_lease, args=(job['job_id'], lease, done), daemon=True).start()
+    try:
+        if handler is None:
+            raise RuntimeError(f"등록되지 않은 작업 종류: {job['job_type']}")
+        handler(**json.loads(job['payload']))
+        done.set()
+        store.finish(job['job_id'], STATUS_DONE)
+    except Exception as e:
+        done.set()
+        if attempts >= JOB_MAX_ATTEMPTS:
+            print(f"❌ Job Failed ({job['job_id']}, {attempts}회 시도): {e}")
+            store.finish(job['job_id'], STATUS_FAILED, error=str(e))
+            return
+        # 지수 백오프 + 지터: 2, 4, 8... 초 (최대 JOB_BACKOFF_MAX)
+        delay = min(JOB_BACKOFF_MAX, JOB_BACKOFF_BASE * 2 ** (attempts - 1)) * random.uniform(0.5, 1.0)
+        print(f"⚠️ Job Retry ({job['job_id']}, {attempts}회 실패, {delay:.1f}초 후 재시도): {e}")
+        store.finish(job['job_id'], STATUS_PENDING, run_at=_now_ms() + int(delay * 1000), error=str(e))
+
+def run_due_jobs(limit: int = 10, queue: str = DEFAULT_QUEUE) -> int:
+    """queue에 속한 작업 중 실행할 때가 된 작업을 가져와 실행하고, 실행한 개수를 반환합니다."""
+    if queue == DEFAULT_QUEUE:
+        # 기본 큐: 다른 큐에 등록된 종류를 뺀 모든 작업 (등록되지 않은 종류도 실패 처리되도록 포함)
+        due = store.due(_now_ms(), limit, tuple(_queues), exclude=True)
+    else:
+        due = store.due(_now_ms(), limit, tuple(t for t, q in _queues.items() if q == queue))
+    executed = 0
+    for job in due:
+        # 다른 워커/서버가 먼저 가져갔으면 건너뜀
+        lease = _lease_seconds.get(job['job_type'], JOB_LEASE_SECONDS)
+        if not store.claim(job, _now_ms() + lease * 1000):
+            continue
+        _execute(job, lease)
+        executed += 1
+    return executed
+
+_stop = threading.Event()
+_workers: list[threading.Thread] = []
+
+def _worker_loop(queue: str):
+    wake = _wake[queue]
+    while not _stop.is_set():
+        try:
+            executed = run_due_jobs(queue=queue)
+        except Exception as e:
+            print(f"❌ Job Worker Error: {e}")
+            executed = 0
+        if executed == 0:
+            wake.wait(JOB_POLL_INTERVAL)
+            wake.clear()
+
+def start_workers():
+    """큐별로 워커 스레드를 시작합니다. (기본 큐: JOB_WORKERS개, 그 외 큐: JOB_QUEUE_WORKERS 설정값 또는 1개)"""
+    if isinstance(store, DynamoJobStore):
+        store.create_table_if_not_exists()
+    _stop.clear()
+    for queue in _wake:
+        count = JOB_WORKERS if queue == DEFAULT_QUEUE else JOB_QUEUE_WORKERS.get(queue, 1)
+        for i in range(count):
+            worker = threading.Thread(target=_worker_loop, args=(queue,), name=f"job-worker-{queue}-{i}", daemon=True)
+            worker.start()
+            _workers.append(worker)
+
+def stop_workers(timeout: float = 5.0):
+    _stop.set()
+    for wake in _wake.values():
+        wake.set()
+    for worker in _workers:
+        worker.join(timeout)
+    _workers.clear()
@@ -0,0 +1,82 @@
+# app/services/profiles.py
+# 작성자 프로필(닉네임) 조회: 공용 LRU 캐시 + BatchGetItem 일괄 조회
+
+import threading
+import time
+from collections import OrderedDict
+from ..config import PROFILE_CACHE_SIZE, PROFILE_CACHE_TTL
+from .dynamo_db import batch_get_users
+
+# { email: (만료 시각, 프로필 또는 None) } — None은 "존재하지 않는 유저"도 캐시한다는 뜻
+_cache: "OrderedDict[str, tuple[float, dict | None]]" = OrderedDict()
+_lock = threading.Lock()
+
+# ---------------------------------------------------------
+# 1. LRU 캐시
+# ---------------------------------------------------------
+
+def _get_cached(user_ids: set) -> tuple[dict, list]:
+    """캐시에서 찾은 프로필과, 캐시에 없어 DB 조회가 필요한 id 목록을 반환합니다."""
+    found, missing = {}, []
+    now = time.monotonic()
+    with _lock:
+        for user_id in user_ids:
+            entry = _cache.get(user_id)
+            if entry is None or entry[0] < now:
+                missing.append(user_id)
+                continue
+            _cache.move_to_end(user_id)
+            found[user_id] = entry[1]
+    return found, missing
+
+def _put_cached(profiles: dict):
+    expires_at = time.monotonic() + PROFILE_CACHE_TTL
+    with _lock:
+        for user_id, profile in profiles.items():
+            _cache[user_id] = (expires_at, profile)
+            _cache.move_to_end(user_id)
+        while len(_cache) > PROFILE_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+def invalidate(user_id: str):
+    """회원 정보가 바뀌거나 탈퇴했을 때 캐시에서 제거합니다."""
+    with _lock:
+        _cache.pop(user_id, None)
+
+# ---------------------------------------------------------
+# 2. 프로필 일괄 조회 / 응답 채우기
+# ---------------------------------------------------------
+
+def get_profiles(user_ids) -> dict:
+    """
+    중복을 제거한 user_id들의 프로필을 반환합니다.
+    캐시에 없는 id만 모아 BatchGetItem 한 번으로 조회합니다.
+    """
+    profiles, missing = _get_cached(set(user_ids))
+    if missing:
+        result = batch_get_users(missing)
+        if result is not None:
+            users, unresolved = result
+            fetched = {}
+            # 끝내 조회하지 못한 id는 "없는 유저"로 캐시하지 않음 (다음 요청에서 다시 조회)
+            for user_id in (u for u in missing if u not in unresolved):
+                user = users.get(user_id)
+                fetched[user_id] = {'user_id': user_id, 'nickname': user['nickname']} if user else None
+            _put_cached(fetched)
+            profiles.update(fetched)
+    return profiles
+
+def hydrate_authors(items: list) -> list:
+    """
+    게시글/댓글 목록에 author(작성자 프로필)를 채운 새 목록을 반환합니다.
+    댓글에 저장된 nickname 복사본도 최신 닉네임으로 교체합니다. (원본 dict는 수정하지 않음)
+    """
+    profiles = get_profiles(item['user_id'] for item in items)
+    hydrated = []
+    for item in items:
+        profile = profiles.get(item['user_id'])
+        new_item = {**item, 'author': profile}
+        if profile and 'nickname' in item:
+            new_item['nickname'] = profile['nickname']
+        hydrated.append(new_item)
+    return hydrated
@@ -0,0 +1,43 @@
+# app/services/rate_limit.py
+# 요청 속도 제한 저장소(백엔드)
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from ..config import RATE_LIMIT_MAX_KEYS
+from .token_bucket import TokenBucket
+
+
+class RateLimitBackend(ABC):
+    """
+    속도 제한 상태 저장소 인터페이스.
+    서버 여러 대가 한도를 공유해야 하면 이 클래스를 상속해 공용 저장소(Redis, DynamoDB 등)로 구현합니다.
+    """
+
+    @abstractmethod
+    def hit(self, key: str, rate: float, burst: float) -> float:
+        """
+        key의 요청 1건을 기록합니다.
+        허용되면 0.0, 거부되면 다시 시도할 수 있을 때까지의 시간(초)을 반환합니다.
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """서버 프로세스 메모리에 키별 토큰 버킷을 두는 기본 구현 (가장 오래 안 쓴 키부터 정리)"""
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, rate: float, burst: float) -> float:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(rate, burst)
+                self._buckets[key] = bucket
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+        return bucket.try_acquire()
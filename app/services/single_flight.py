@@ -0,0 +1,111 @@
+# app/services/single_flight.py
+# 동일한 읽기 요청 병합(Single-flight) + 짧은 stale-while-revalidate 캐시
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _Call:
+    """진행 중인 백엔드 호출 하나 (같은 키로 들어온 요청들이 이 결과를 함께 기다림)"""
+
+    def __init__(self, generation: int):
+        self.generation = generation
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    같은 키의 읽기가 동시에 들어오면 백엔드 호출은 한 번만 하고 결과를 나눠 씁니다.
+
+    - fresh_ttl(초) 동안은 마지막 결과를 그대로 반환합니다.
+    - 그 뒤 stale_ttl(초)까지는 이전 결과를 바로 반환하면서 백그라운드에서 한 번만 갱신합니다.
+    - 그 이후에는 새로 호출하며, 그동안 들어온 같은 요청은 이 호출에 합류(merge)합니다.
+    """
+
+    def __init__(self, fresh_ttl: float, stale_ttl: float, max_entries: int = 5000):
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = max(stale_ttl, fresh_ttl)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._inflight: dict[tuple, _Call] = {}
+        # forget()이 호출될 때마다 증가. 그 이전에 시작된 호출의 결과는 캐시하지 않습니다.
+        self._generation = 0
+        # { key: (저장 시각, 결과) }
+        self._results: "OrderedDict[tuple, tuple[float, object]]" = OrderedDict()
+        self._refresher = ThreadPoolExecutor(max_workers=4, thread_name_prefix="swr-refresh")
+        self._stats = {"calls": 0, "backend_calls": 0, "merged": 0, "fresh_hits": 0, "stale_hits": 0}
+
+    def do(self, key: tuple, fn):
+        """key에 해당하는 결과를 반환합니다. 필요할 때만 fn()을 호출합니다."""
+        with self._lock:
+            self._stats["calls"] += 1
+            cached = self._results.get(key)
+            age = time.monotonic() - cached[0] if cached else None
+            if cached and age < self.fresh_ttl:
+                self._stats["fresh_hits"] += 1
+                return cached[1]
+
+            call = self._inflight.get(key)
+            if cached and age < self.stale_ttl:
+                self._stats["stale_hits"] += 1
+                if call is None:
+                    call = self._start_locked(key)
+                    self._refresher.submit(self._run, key, fn, call)
+                return cached[1]
+
+            if call is not None:
+                self._stats["merged"] += 1
+                leader = False
+            else:
+                call = self._start_locked(key)
+                leader = True
+
+        if leader:
+            self._run(key, fn, call)
+        else:
+            call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.value
+
+    def _start_locked(self, key: tuple) -> _Call:
+        call = _Call(self._generation)
+        self._inflight[key] = call
+        self._stats["backend_calls"] += 1
+        return call
+
+    def _run(self, key: tuple, fn, call: _Call):
+        try:
+            call.value = fn()
+        except Exception as e:
+            call.error = e
+        with self._lock:
+            if self._inflight.get(key) is call:
+                del self._inflight[key]
+            if call.error is None and self.stale_ttl > 0 and call.generation == self._generation:
+                self._results[key] = (time.monotonic(), call.value)
+                self._results.move_to_end(key)
+                while len(self._results) > self.max_entries:
+                    self._results.popitem(last=False)
+        call.done.set()
+
+    def forget(self, *prefix):
+        """
+        key가 prefix로 시작하는 캐시 결과를 지웁니다. (쓰기 후 본인 변경이 바로 보이도록)
+        예: forget("posts", "식단") → 식단 게시판 목록 캐시 전체 삭제
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._results if k[:len(prefix)] == prefix]:
+                del self._results[key]
+            # 쓰기 이전에 시작된 호출에는 새 요청이 합류하지 않도록 분리
+            for key in [k for k in self._inflight if k[:len(prefix)] == prefix]:
+                del self._inflight[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats, inflight=len(self._inflight), cached=len(self._results))
@@ -0,0 +1,218 @@
+# app/services/table_export.py
+# 게시글/댓글 테이블 전체 내보내기 (세그먼트 병렬 Scan → NDJSON 파일, 로컬 또는 S3)
+#
+# - 테이블을 TotalSegments개로 나눠 여러 워커 프로세스가 동시에 Scan 합니다.
+# - 읽기 용량(RCU) 예산을 프로세스별 토큰 버킷으로 나눠 서비스 트래픽을 잠식하지 않도록 합니다.
+# - 파일(chunk)을 하나 쓸 때마다 세그먼트별 체크포인트(LastEvaluatedKey)를 저장하므로
+#   중단되더라도 --resume 으로 마지막 체크포인트부터 이어서 내보낼 수 있습니다.
+
+import base64
+import gzip
+import json
+import multiprocessing
+import os
+import shutil
+from decimal import Decimal
+from boto3.dynamodb.types import TypeDeserializer, Binary
+from ..config import (
+    POSTS_TABLE_NAME, COMMENTS_TABLE_NAME,
+    EXPORT_SEGMENTS, EXPORT_WORKERS, EXPORT_RCU_BUDGET, EXPORT_CHUNK_SIZE, EXPORT_CHECKPOINT_DIR,
+)
+from .aws_client import get_client
+from .token_bucket import TokenBucket
+from .jobs import job_handler
+
+# 내보낼 수 있는 테이블 (별칭 → 실제 테이블 이름)
+EXPORT_TABLES = {
+    "posts": POSTS_TABLE_NAME,
+    "comments": COMMENTS_TABLE_NAME,
+}
+
+# Scan 한 페이지(최대 1MB)를 eventually consistent로 읽을 때의 최대 소비 RCU
+_MAX_PAGE_RCU = 128
+
+_deserializer = TypeDeserializer()
+
+# 워커 프로세스마다 하나씩 두는 RCU 토큰 버킷 (_init_worker에서 생성, 세그먼트 간 공유)
+_worker_bucket: TokenBucket | None = None
+# 이미 읽었지만 아직 토큰을 내지 않은 RCU (다음 Scan 전에 먼저 지불)
+_worker_debt = 0.0
+
+# ---------------------------------------------------------
+# 1. 직렬화 / 출력 헬퍼
+# ---------------------------------------------------------
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if isinstance(value, Binary):
+        return base64.b64encode(value.value).decode('ascii')
+    raise TypeError(f"직렬화할 수 없는 값: {type(value)}")
+
+def _to_ndjson_line(item: dict) -> str:
+    plain = {key: _deserializer.deserialize(value) for key, value in item.items()}
+    return json.dumps(plain, ensure_ascii=False, default=_json_default) + "\n"
+
+def _write_chunk(output: str, file_name: str, lines: list, compress: bool):
+    """chunk 하나를 로컬 디렉터리 또는 S3(s3://bucket/prefix)에 씁니다. 같은 이름이면 덮어씁니다."""
+    body = "".join(lines).encode('utf-8')
+    if compress:
+        body = gzip.compress(body)
+    if output.startswith("s3://"):
+        bucket, _, prefix = output[len("s3://"):].partition("/")
+        key = f"{prefix.rstrip('/')}/{file_name}" if prefix else file_name
+        get_client('s3').put_object(Bucket=bucket, Key=key, Body=body)
+        return
+    path = os.path.join(output, file_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+
+# ---------------------------------------------------------
+# 2. 체크포인트 (세그먼트별 JSON 파일)
+# ---------------------------------------------------------
+
+def _checkpoint_path(checkpoint_dir: str, segment: int) -> str:
+    return os.path.join(checkpoint_dir, f"segment-{segment:04d}.json")
+
+def _load_checkpoint(checkpoint_dir: str, segment: int) -> dict:
+    try:
+        with open(_checkpoint_path(checkpoint_dir, segment), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'start_key': None, 'part': 0, 'items': 0, 'done': False}
+
+def _save_checkpoint(checkpoint_dir: str, segment: int, checkpoint: dict):
+    path = _checkpoint_path(checkpoint_dir, segment)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+# ---------------------------------------------------------
+# 3. 세그먼트 Scan (워커 프로세스에서 실행)
+# ---------------------------------------------------------
+
+def _init_worker(rcu_per_worker: float):
+    """
+    워커 프로세스 시작 시 한 번 호출됩니다. 버킷을 비운 상태로 시작해 처음부터 초당 rcu_per_worker를 넘지 않게 합니다.
+    """
+    global _worker_bucket, _worker_debt
+    _worker_bucket = TokenBucket(rcu_per_worker, max(rcu_per_worker, _MAX_PAGE_RCU), tokens=0)
+    _worker_debt = 0.0
+
+def _pay_rcu_debt():
+    """직전 페이지가 소비한 RCU만큼 토큰을 얻을 때까지 대기합니다. (다음 Scan을 보내기 전에 호출)"""
+    global _worker_debt
+    if _worker_debt > 0:
+        _worker_bucket.acquire(min(_worker_debt, _worker_bucket.capacity))
+        _worker_debt = 0.0
+
+def _export_segment(task: dict) -> dict:
+    global _worker_debt
+    segment = task['segment']
+    total_segments = task['total_segments']
+    compress = task['compress']
+    extension = "ndjson.gz" if compress else "ndjson"
+    checkpoint = _load_checkpoint(task['checkpoint_dir'], segment)
+    if checkpoint['done']:
+        return {'segment': segment, 'items': checkpoint['items'], 'parts': checkpoint['part'], 'resumed': True}
+
+    # 풀 없이 단일 프로세스에서 직접 호출된 경우 전체 예산으로 버킷을 만듦
+    if _worker_bucket is None:
+        _init_worker(EXPORT_RCU_BUDGET)
+
+    client = get_client('dynamodb')
+    scan_kwargs = {
+        'TableName': task['table_name'],
+        'Segment': segment,
+        'TotalSegments': total_segments,
+        'ReturnConsumedCapacity': 'TOTAL',
+    }
+    if checkpoint['start_key']:
+        scan_kwargs['ExclusiveStartKey'] = checkpoint['start_key']
+
+    lines = []
+    while True:
+        # 페이지 비용은 읽어봐야 알 수 있으므로, 직전 페이지 비용을 다음 Scan 전에 지불 (예산을 넘으면 여기서 대기)
+        _pay_rcu_debt()
+        response = client.scan(**scan_kwargs)
+        lines.extend(_to_ndjson_line(item) for item in response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        _worker_debt += response.get('ConsumedCapacity', {}).get('CapacityUnits', 1)
+
+        # 페이지 경계에서만 파일을 끊어야 체크포인트(LastEvaluatedKey)와 파일 내용이 일치합니다.
+        if len(lines) >= task['chunk_size'] or (not last_key and lines):
+            file_name = f"{task['table_name']}/segment-{segment:04d}-part-{checkpoint['part']:05d}.{extension}"
+            _write_chunk(task['output'], file_name, lines, compress)
+            checkpoint['part'] += 1
+            checkpoint['items'] += len(lines)
+            checkpoint['start_key'] = last_key
+            lines = []
+            _save_checkpoint(task['checkpoint_dir'], segment, checkpoint)
+
+        if not last_key:
+            break
+        scan_kwargs['ExclusiveStartKey'] = last_key
+
+    checkpoint['done'] = True
+    _save_checkpoint(task['checkpoint_dir'], segment, checkpoint)
+    return {'segment': segment, 'items': checkpoint['items'], 'parts': checkpoint['part'], 'resumed': False}
+
+# ---------------------------------------------------------
+# 4. 내보내기 실행
+# ---------------------------------------------------------
+
+def export_table(table: str, output: str, segments: int = EXPORT_SEGMENTS, workers: int = EXPORT_WORKERS,
+                 rcu_budget: float = EXPORT_RCU_BUDGET, chunk_size: int = EXPORT_CHUNK_SIZE,
+                 compress: bool = False, resume: bool = False, checkpoint_dir: str | None = None) -> dict:
+    """
+    테이블(posts/comments)을 segments개로 나눠 workers개 프로세스로 병렬 Scan 하여 내보냅니다.
+    resume=False면 기존 체크포인트를 지우고 처음부터, True면 체크포인트부터 이어서 진행합니다.
+    """
+    if table not in EXPORT_TABLES:
+        raise ValueError(f"지원하지 않는 테이블: {table} (가능: {', '.join(EXPORT_TABLES)})")
+    table_name = EXPORT_TABLES[table]
+    checkpoint_dir = checkpoint_dir or os.path.join(EXPORT_CHECKPOINT_DIR, table_name)
+    if not resume and os.path.isdir(checkpoint_dir):
+        shutil.rmtree(checkpoint_dir)
+    os.makedirs(checkpoint_dir, exist_ok=True)
+
+    workers = max(1, min(workers, segments))
+    tasks = [{
+        'table_name': table_name,
+        'segment': segment,
+        'total_segments': segments,
+        'output': output,
+        'compress': compress,
+        'chunk_size': chunk_size,
+        'checkpoint_dir': checkpoint_dir,
+    } for segment in range(segments)]
+
+    # 서버(스레드) 안에서도 안전하도록 fork 대신 spawn으로 워커 프로세스를 만듭니다.
+    # RCU 예산은 워커 수로 나눠 프로세스별 버킷 하나에 배정합니다. (한 워커가 여러 세그먼트를 처리해도 공유)
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=workers, initializer=_init_worker, initargs=(rcu_budget / workers,)) as pool:
+        results = pool.map(_export_segment, tasks, chunksize=1)
+
+    summary = {
+        'table': table_name,
+        'output': output,
+        'segments': segments,
+        'items': sum(r['items'] for r in results),
+        'files': sum(r['parts'] for r in results),
+    }
+    print(f"✅ 내보내기 완료: {summary}")
+    return summary
+
+@job_handler("export_table", lease_seconds=600, queue="export")
+def export_table_job(**kwargs):
+    """
+    관리자 API에서 예약한 내보내기 작업 (재시도 시 체크포인트부터 이어서 진행)
+    전용 큐에서 실행되어 삭제 정리 작업을 막지 않고, 실행 중에는 lease가 계속 연장됩니다.
+    """
+    export_table(**kwargs, resume=True)
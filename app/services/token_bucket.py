@@ -0,0 +1,83 @@
+# app/services/token_bucket.py
+# 토큰 버킷(Token Bucket) 기반 요청 속도 제한기
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 토큰이 채워지고 최대 capacity개까지 쌓이는 버킷입니다.
+    요청 1건당 토큰 1개를 소비하며, 여러 스레드에서 동시에 사용해도 안전합니다.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None, tokens: float | None = None):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        # 처음 채워둘 토큰 수 (기본: 가득 참, 0이면 처음부터 rate 속도로만 소비 가능)
+        self._tokens = self.capacity if tokens is None else min(self.capacity, float(tokens))
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        # 마지막 스로틀링 시각과 그때 낮춘 속도 (회복은 이 시점부터 경과 시간에 비례)
+        self._penalized_at = None
+        self._penalized_rate = self.rate
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 즉시 소비해봅니다.
+        성공하면 0.0, 실패하면 토큰이 채워질 때까지 기다려야 하는 시간(초)을 반환합니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, timeout: float | None = None) -> bool:
+        """
+        토큰을 얻을 때까지 대기합니다. timeout(초) 안에 얻지 못하면 False를 반환합니다.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0.0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    # --- 스로틀링 대응 (AIMD: 실패 시 절반으로, 이후 경과 시간에 비례해 회복) ---
+
+    def penalize(self, factor: float = 0.5, min_rate: float = 1.0):
+        """서버 측 스로틀링을 감지했을 때 충전 속도를 줄입니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(min_rate, self.rate * factor)
+            self._penalized_at = now
+            self._penalized_rate = self.rate
+
+    def recover(self, rate_per_second: float = 5.0):
+        """
+        정상 응답을 받으면 마지막 스로틀링 이후 경과한 시간(초)마다 rate_per_second씩 충전 속도를 되돌립니다.
+        응답 건수와 무관하므로 트래픽이 많아도 회복 속도가 빨라지지 않습니다.
+        """
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            elapsed = now - self._penalized_at if self._penalized_at is not None else 0.0
+            self.rate = min(self.max_rate, self._penalized_rate + elapsed * rate_per_second)
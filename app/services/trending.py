@@ -0,0 +1,188 @@
+# app/services/trending.py
+# 인기글(Trending) 피드: 조회/댓글 이벤트마다 점수를 증분 갱신하고 게시판별 top-K를 메모리에 유지
+#
+# 후보군은 서버 프로세스마다 따로 유지됩니다. (uvicorn 워커가 여러 개면 워커별로 피드가 조금씩 다름)
+# 다른 프로세스(백그라운드 작업 등)에서 삭제된 글은 retain()으로 주기적으로 정리합니다.
+
+import json
+import math
+import os
+import heapq
+import threading
+from datetime import datetime
+from decimal import Decimal
+from ..config import (
+    TRENDING_HALF_LIFE_HOURS,
+    TRENDING_VIEW_WEIGHT,
+    TRENDING_COMMENT_WEIGHT,
+    TRENDING_POST_WEIGHT,
+    TRENDING_CAPACITY,
+    TRENDING_SNAPSHOT_PATH,
+)
+
+# 점수는 기준 시각(EPOCH)으로 환산한 값을 로그 스케일로 저장합니다.
+#   log_score = log Σ w_i * 2^((t_i - EPOCH) / half_life)
+# 모든 글이 같은 비율로 감쇠하므로, 시간이 흘러도 재계산 없이 순위를 비교할 수 있습니다.
+_EPOCH = datetime(2024, 1, 1).timestamp()
+_HALF_LIFE_SEC = TRENDING_HALF_LIFE_HOURS * 3600
+
+# 응답(PostResponse)에 필요한 필드만 스냅샷으로 보관
+_SNAPSHOT_FIELDS = (
+    'post_id', 'user_id', 'title', 'content', 'post_type',
+    'file_urls', 'created_at', 'view_count', 'feedback_count',
+)
+
+# 게시판별 { post_id: {"score": 로그 점수, "post": 게시글 스냅샷} }
+_boards: dict[str, dict[str, dict]] = {}
+_lock = threading.Lock()
+
+# ---------------------------------------------------------
+# 내부 헬퍼
+# ---------------------------------------------------------
+
+def _log_weight(weight: float, ts: float) -> float:
+    return math.log(weight) + (ts - _EPOCH) / _HALF_LIFE_SEC * math.log(2)
+
+def _log_add(a: float | None, b: float) -> float:
+    if a is None:
+        return b
+    hi, lo = max(a, b), min(a, b)
+    return hi + math.log1p(math.exp(lo - hi))
+
+def _snapshot(post: dict) -> dict:
+    snap = {}
+    for field in _SNAPSHOT_FIELDS:
+        if field in post:
+            value = post[field]
+            snap[field] = int(value) if isinstance(value, Decimal) else value
+    return snap
+
+def _remove_locked(post_id: str):
+    for board in _boards.values():
+        board.pop(post_id, None)
+
+def _record(post: dict, weight: float, ts: float | None = None):
+    """
+    이벤트 하나를 게시글 점수에 더합니다. 후보군이 가득 차면 점수가 가장 낮은 글을 내보냅니다.
+    """
+    if not post or weight <= 0 or 'post_type' not in post:
+        return
+    post_id = post['post_id']
+    delta = _log_weight(weight, ts if ts is not None else datetime.now().timestamp())
+    with _lock:
+        board = _boards.setdefault(post['post_type'], {})
+        entry = board.get(post_id)
+        if entry is None:
+            # 게시판이 바뀐 글이면 이전 게시판의 점수를 가져옵니다.
+            for other in _boards.values():
+                if post_id in other:
+                    entry = other.pop(post_id)
+                    break
+        score = _log_add(entry['score'] if entry else None, delta)
+        board[post_id] = {'score': score, 'post': _snapshot(post)}
+        if len(board) > TRENDING_CAPACITY:
+            lowest = min(board, key=lambda pid: board[pid]['score'])
+            del board[lowest]
+
+def _created_ts(post: dict) -> float | None:
+    try:
+        return datetime.fromisoformat(post['created_at']).timestamp()
+    except (KeyError, ValueError):
+        return None
+
+# ---------------------------------------------------------
+# 1. 이벤트 기록 (dynamo_db 서비스에서 호출)
+# ---------------------------------------------------------
+
+def record_post(post: dict):
+    """새 글 작성: 작성 시각 기준 최신성 점수를 부여합니다."""
+    _record(post, TRENDING_POST_WEIGHT, _created_ts(post))
+
+def record_view(post: dict, count: int = 1):
+    """조회수 증가 (갱신된 게시글 전체를 받아 스냅샷도 함께 갱신, count: 합산된 조회 수)"""
+    _record(post, TRENDING_VIEW_WEIGHT * count)
+
+def record_comment(post: dict):
+    """댓글 작성 (갱신된 게시글 전체를 받아 스냅샷도 함께 갱신)"""
+    _record(post, TRENDING_COMMENT_WEIGHT)
+
+def update_post(post: dict):
+    """게시글 수정: 점수는 유지하고 스냅샷(제목, 게시판 등)만 교체합니다."""
+    if not post:
+        return
+    with _lock:
+        entry = None
+        for board in _boards.values():
+            if post['post_id'] in board:
+                entry = board.pop(post['post_id'])
+                break
+        if entry is not None:
+            _boards.setdefault(post['post_type'], {})[post['post_id']] = {
+                'score': entry['score'], 'post': _snapshot(post)
+            }
+
+def remove_post(post_id: str):
+    """게시글 삭제 시 인기글 후보에서 제외합니다."""
+    with _lock:
+        _remove_locked(post_id)
+
+def post_ids() -> list:
+    """현재 후보군에 있는 모든 게시글 id (삭제 여부 확인용)"""
+    with _lock:
+        return [post_id for board in _boards.values() for post_id in board]
+
+def retain(existing_ids: set):
+    """existing_ids에 없는 글(다른 프로세스에서 삭제됐거나 서버가 꺼져 있는 동안 삭제된 글)을 후보에서 제외합니다."""
+    with _lock:
+        removed = 0
+        for board in _boards.values():
+            for post_id in [pid for pid in board if pid not in existing_ids]:
+                del board[post_id]
+                removed += 1
+    if removed:
+        print(f"🧹 삭제된 인기글 후보 {removed}개 정리")
+
+# ---------------------------------------------------------
+# 2. 인기글 조회 (전체 게시판 조회 없이 메모리에서 바로 반환)
+# ---------------------------------------------------------
+
+def get_trending(post_type: str, limit: int = 20) -> list:
+    with _lock:
+        board = _boards.get(post_type, {})
+        top = heapq.nlargest(limit, board.values(), key=lambda e: e['score'])
+        return [dict(entry['post']) for entry in top]
+
+# ---------------------------------------------------------
+# 3. 스냅샷 저장/복원 (서버 재시작 시 점수 유지)
+# ---------------------------------------------------------
+
+def save_snapshot(path: str = TRENDING_SNAPSHOT_PATH):
+    with _lock:
+        data = json.dumps(_boards, ensure_ascii=False)
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"❌ Trending Snapshot Save Error: {e}")
+
+def load_snapshot(path: str = TRENDING_SNAPSHOT_PATH) -> bool:
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError) as e:
+        print(f"❌ Trending Snapshot Load Error: {e}")
+        return False
+    with _lock:
+        _boards.clear()
+        _boards.update(data)
+    print(f"✅ 인기글 스냅샷 복원 완료 ({sum(len(b) for b in data.values())}개)")
+    return True
+
+def warm_up(posts: list):
+    """스냅샷이 없을 때 최근 게시글의 최신성 점수로 후보군을 채웁니다."""
+    for post in posts:
+        record_post(post)
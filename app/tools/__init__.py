@@ -0,0 +1 @@
+# app.tools package (운영용 CLI 도구)
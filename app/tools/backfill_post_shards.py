@@ -0,0 +1,130 @@
+# app/tools/backfill_post_shards.py
+# 기존 게시글에 post_type_shard 값을 채워 넣는 백필 도구
+#
+# 사용법:
+#   POST_TYPE_SHARDS=8 python -m app.tools.backfill_post_shards --create-index
+#   POST_TYPE_SHARDS=8 python -m app.tools.backfill_post_shards --dry-run
+#   POST_TYPE_SHARDS=8 POST_SHARD_READS=true python -m app.tools.backfill_post_shards --drop-type-index
+#
+# 순서: (1) POST_TYPE_SHARDS 설정 후 서버 배포 (새 글부터 샤드 키 기록)
+#       (2) 이 도구로 인덱스 생성 + 기존 글 백필
+#       (3) POST_SHARD_READS=true 로 목록 조회를 샤딩 인덱스로 전환
+#       (4) 모든 서버가 (3)으로 배포된 뒤 --drop-type-index 로 Type-CreatedAt-Index 삭제
+#           (post_type 하나에 쓰기가 몰리는 인덱스 파티션이 남아 있으면 쓰기 핫 파티션이 그대로이므로)
+
+import argparse
+from botocore.exceptions import ClientError
+
+from ..config import POST_TYPE_SHARDS, POST_SHARD_READS, POST_SHARD_INDEX_NAME, POST_TYPE_INDEX_NAME
+from ..services.dynamo_db import posts_table, post_shard_key
+
+
+def create_shard_index():
+    """샤딩 GSI(post_type_shard + created_at)가 없으면 생성합니다."""
+    existing = [gsi['IndexName'] for gsi in (posts_table.global_secondary_indexes or [])]
+    if POST_SHARD_INDEX_NAME in existing:
+        print(f"ℹ 인덱스({POST_SHARD_INDEX_NAME})가 이미 존재합니다.")
+        return
+    print(f"🔨 인덱스({POST_SHARD_INDEX_NAME}) 생성 요청 중...")
+    posts_table.meta.client.update_table(
+        TableName=posts_table.name,
+        AttributeDefinitions=[
+            {'AttributeName': 'post_type_shard', 'AttributeType': 'S'},
+            {'AttributeName': 'created_at', 'AttributeType': 'S'},
+        ],
+        GlobalSecondaryIndexUpdates=[{
+            'Create': {
+                'IndexName': POST_SHARD_INDEX_NAME,
+                'KeySchema': [
+                    {'AttributeName': 'post_type_shard', 'KeyType': 'HASH'},
+                    {'AttributeName': 'created_at', 'KeyType': 'RANGE'},
+                ],
+                'Projection': {'ProjectionType': 'ALL'},
+            }
+        }],
+    )
+    print("✅ 인덱스 생성 요청 완료 (ACTIVE 상태가 될 때까지 몇 분 걸릴 수 있습니다)")
+
+
+def _index_statuses() -> dict:
+    posts_table.reload()
+    return {gsi['IndexName']: gsi.get('IndexStatus') for gsi in (posts_table.global_secondary_indexes or [])}
+
+
+def drop_type_index():
+    """
+    샤딩 인덱스로 전환이 끝난 뒤 게시판 단일 키 GSI(Type-CreatedAt-Index)를 삭제합니다.
+    샤딩 인덱스가 ACTIVE가 아니면 목록 조회가 끊기므로 삭제하지 않습니다.
+    """
+    statuses = _index_statuses()
+    if POST_TYPE_INDEX_NAME not in statuses:
+        print(f"ℹ 인덱스({POST_TYPE_INDEX_NAME})가 이미 없습니다.")
+        return
+    if statuses.get(POST_SHARD_INDEX_NAME) != 'ACTIVE':
+        print(f"❌ 인덱스({POST_SHARD_INDEX_NAME})가 ACTIVE 상태가 아니어서 {POST_TYPE_INDEX_NAME}를 삭제하지 않습니다.")
+        return
+    print(f"🗑️ 인덱스({POST_TYPE_INDEX_NAME}) 삭제 요청 중...")
+    posts_table.meta.client.update_table(
+        TableName=posts_table.name,
+        GlobalSecondaryIndexUpdates=[{'Delete': {'IndexName': POST_TYPE_INDEX_NAME}}],
+    )
+    print("✅ 인덱스 삭제 요청 완료 (이후 게시글 쓰기는 샤딩 인덱스 파티션에만 분산됩니다)")
+
+
+def backfill(dry_run: bool = False) -> int:
+    """모든 게시글을 Scan하며 샤드 키가 없거나 다른 글만 업데이트합니다."""
+    updated = 0
+    scan_kwargs = {'ProjectionExpression': 'post_id, post_type, post_type_shard'}
+    while True:
+        response = posts_table.scan(**scan_kwargs)
+        for item in response.get('Items', []):
+            expected = post_shard_key(item['post_type'], item['post_id'])
+            if item.get('post_type_shard') == expected:
+                continue
+            if not dry_run:
+                try:
+                    posts_table.update_item(
+                        Key={'post_id': item['post_id']},
+                        UpdateExpression="SET post_type_shard = :s",
+                        ExpressionAttributeValues={':s': expected},
+                        # 백필 도중 삭제된 글이 다시 생기지 않도록 존재할 때만 업데이트
+                        ConditionExpression="attribute_exists(post_id)"
+                    )
+                except ClientError as e:
+                    if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                        raise
+                    continue
+            updated += 1
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return updated
+        scan_kwargs['ExclusiveStartKey'] = last_key
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글 post_type_shard 백필")
+    parser.add_argument("--create-index", action="store_true", help="샤딩 GSI가 없으면 생성")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 대상 개수만 출력")
+    parser.add_argument("--drop-type-index", action="store_true",
+                        help="샤딩 조회 전환 후 Type-CreatedAt-Index 삭제 (백필은 하지 않음)")
+    args = parser.parse_args()
+
+    if POST_TYPE_SHARDS <= 0:
+        parser.error("POST_TYPE_SHARDS 환경 변수를 1 이상으로 설정하세요.")
+
+    if args.drop_type_index:
+        if not POST_SHARD_READS:
+            parser.error("POST_SHARD_READS=true 로 목록 조회를 전환한 뒤에만 삭제할 수 있습니다.")
+        drop_type_index()
+        return
+
+    if args.create_index and not args.dry_run:
+        create_shard_index()
+
+    count = backfill(dry_run=args.dry_run)
+    action = "대상" if args.dry_run else "업데이트 완료"
+    print(f"✅ 샤드 키 {action}: {count}개 (샤드 수: {POST_TYPE_SHARDS})")
+
+
+if __name__ == "__main__":
+    main()
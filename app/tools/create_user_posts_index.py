@@ -0,0 +1,73 @@
+# app/tools/create_user_posts_index.py
+# 내가 쓴 글 조회용 GSI(User-CreatedAt-Index) 생성 도구
+#
+# 사용법:
+#   python -m app.tools.create_user_posts_index
+#   python -m app.tools.create_user_posts_index --wait   # ACTIVE 상태가 될 때까지 대기
+#
+# 인덱스가 없는 동안 /api/v1/posts/me 는 전체 테이블 Scan으로 동작하므로 배포 후 한 번 실행하세요.
+# 기존 게시글에는 이미 user_id / created_at 이 있으므로 별도 백필은 필요 없습니다.
+
+import argparse
+import time
+
+from ..config import USER_POSTS_INDEX_NAME
+from ..services.dynamo_db import posts_table
+
+
+def _index_status() -> str | None:
+    posts_table.reload()
+    for gsi in posts_table.global_secondary_indexes or []:
+        if gsi['IndexName'] == USER_POSTS_INDEX_NAME:
+            return gsi.get('IndexStatus')
+    return None
+
+
+def create_user_posts_index():
+    """작성자 GSI(user_id + created_at)가 없으면 생성합니다."""
+    if _index_status() is not None:
+        print(f"ℹ 인덱스({USER_POSTS_INDEX_NAME})가 이미 존재합니다.")
+        return
+    print(f"🔨 인덱스({USER_POSTS_INDEX_NAME}) 생성 요청 중...")
+    posts_table.meta.client.update_table(
+        TableName=posts_table.name,
+        AttributeDefinitions=[
+            {'AttributeName': 'user_id', 'AttributeType': 'S'},
+            {'AttributeName': 'created_at', 'AttributeType': 'S'},
+        ],
+        GlobalSecondaryIndexUpdates=[{
+            'Create': {
+                'IndexName': USER_POSTS_INDEX_NAME,
+                'KeySchema': [
+                    {'AttributeName': 'user_id', 'KeyType': 'HASH'},
+                    {'AttributeName': 'created_at', 'KeyType': 'RANGE'},
+                ],
+                'Projection': {'ProjectionType': 'ALL'},
+            }
+        }],
+    )
+    print("✅ 인덱스 생성 요청 완료 (ACTIVE 상태가 될 때까지 몇 분 걸릴 수 있습니다)")
+
+
+def wait_until_active(poll_seconds: float = 15):
+    while True:
+        status = _index_status()
+        print(f"⏳ 인덱스 상태: {status}")
+        if status == 'ACTIVE':
+            return
+        time.sleep(poll_seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="User-CreatedAt-Index 생성")
+    parser.add_argument("--wait", action="store_true", help="인덱스가 ACTIVE 상태가 될 때까지 대기")
+    args = parser.parse_args()
+
+    create_user_posts_index()
+    if args.wait:
+        wait_until_active()
+        print(f"✅ 인덱스({USER_POSTS_INDEX_NAME}) 사용 가능")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# app/tools/export_tables.py
+# 게시글/댓글 테이블 내보내기 CLI (백업, 분석, 파생 데이터 재생성용)
+#
+# 사용법:
+#   python -m app.tools.export_tables posts --output ./exports
+#   python -m app.tools.export_tables comments --output s3://health-project-ccc/exports/2026-10-19 --gzip
+#   python -m app.tools.export_tables posts --output ./exports --segments 16 --workers 8 --rcu 200
+#   python -m app.tools.export_tables posts --output ./exports --resume   # 중단된 내보내기 이어서 진행
+
+import argparse
+
+from ..config import EXPORT_SEGMENTS, EXPORT_WORKERS, EXPORT_RCU_BUDGET, EXPORT_CHUNK_SIZE
+from ..services.table_export import EXPORT_TABLES, export_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DynamoDB 테이블 병렬 Scan 내보내기 (NDJSON)")
+    parser.add_argument("table", choices=sorted(EXPORT_TABLES), help="내보낼 테이블")
+    parser.add_argument("--output", required=True, help="로컬 디렉터리 또는 s3://bucket/prefix")
+    parser.add_argument("--segments", type=int, default=EXPORT_SEGMENTS, help="병렬 Scan 세그먼트 수")
+    parser.add_argument("--workers", type=int, default=EXPORT_WORKERS, help="워커 프로세스 수")
+    parser.add_argument("--rcu", type=float, default=EXPORT_RCU_BUDGET, help="전체 초당 읽기 용량(RCU) 한도")
+    parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE, help="파일 하나당 대략적인 항목 수")
+    parser.add_argument("--gzip", action="store_true", help="gzip 압축 (.ndjson.gz)")
+    parser.add_argument("--resume", action="store_true", help="마지막 체크포인트부터 이어서 진행")
+    parser.add_argument("--checkpoint-dir", help="체크포인트 저장 경로 (기본: export_checkpoints/<테이블>)")
+    args = parser.parse_args()
+
+    if args.segments < 1 or args.workers < 1 or args.rcu <= 0 or args.chunk_size < 1:
+        parser.error("--segments, --workers, --chunk-size는 1 이상, --rcu는 0보다 커야 합니다.")
+
+    export_table(
+        args.table, args.output,
+        segments=args.segments, workers=args.workers, rcu_budget=args.rcu,
+        chunk_size=args.chunk_size, compress=args.gzip, resume=args.resume,
+        checkpoint_dir=args.checkpoint_dir,
+    )
+
+
+if __name__ == "__main__":
+    main()